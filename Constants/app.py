@@ -1,8 +1,15 @@
-import copy
+from collections import namedtuple
 
 from constants import PLAYERS, TEAMS
 
 
+# Summary of a team's roster, computed once and reused on repeat viewings
+TeamStats = namedtuple('TeamStats', [
+    'player_names', 'guardians', 'num_experienced',
+    'num_inexperienced', 'avg_height', 'total_players',
+])
+
+
 def clean_data(players):
     """
     Clean player data without modifying the original.
@@ -10,19 +17,20 @@ def clean_data(players):
     - Experience: converted to boolean (True/False)
     - Guardians: converted from string to list (split on ' and ')
     """
-    cleaned_players = copy.deepcopy(players)
-
-    for player in cleaned_players:
-        # Convert height from "42 inches" to 42
-        player['height'] = int(player['height'].split()[0])
-
-        # Convert experience from "YES"/"NO" to True/False
-        player['experience'] = player['experience'].upper() == 'YES'
-
-        # Convert guardians from string to list
-        player['guardians'] = player['guardians'].split(" and ")
-
-    return cleaned_players
+    # Build fresh dicts in one pass; the converted fields are new objects,
+    # so the original PLAYERS data is never touched (no deepcopy needed)
+    return [
+        {
+            **player,
+            # Convert height from "42 inches" to 42
+            'height': int(player['height'].split()[0]),
+            # Convert experience from "YES"/"NO" to True/False
+            'experience': player['experience'].upper() == 'YES',
+            # Convert guardians from string to list
+            'guardians': player['guardians'].split(" and "),
+        }
+        for player in players
+    ]
 
 
 def balance_teams(players, teams):
@@ -31,30 +39,21 @@ def balance_teams(players, teams):
     Ensures each team has the same number of experienced and inexperienced players.
     Returns a dictionary with team names as keys and lists of players as values.
     """
-    # Separate players by experience
-    experienced = [player for player in players if player['experience']]
-    inexperienced = [player for player in players if not player['experience']]
-    
+    # Separate players by experience in a single pass
+    experienced, inexperienced = [], []
+    for player in players:
+        (experienced if player['experience'] else inexperienced).append(player)
+
     # Calculate how many of each type per team
     exp_per_team = len(experienced) // len(teams)
     inexp_per_team = len(inexperienced) // len(teams)
-    
-    # Create a dictionary to hold each team's roster
-    team_rosters = {team: [] for team in teams}
-    
-    # Distribute experienced players evenly
-    for i, team in enumerate(teams):
-        start = i * exp_per_team
-        end = start + exp_per_team
-        team_rosters[team].extend(experienced[start:end])
-    
-    # Distribute inexperienced players evenly
-    for i, team in enumerate(teams):
-        start = i * inexp_per_team
-        end = start + inexp_per_team
-        team_rosters[team].extend(inexperienced[start:end])
-    
-    return team_rosters
+
+    # Give each team its slice of experienced and inexperienced players
+    return {
+        team: (experienced[i * exp_per_team:(i + 1) * exp_per_team]
+               + inexperienced[i * inexp_per_team:(i + 1) * inexp_per_team])
+        for i, team in enumerate(teams)
+    }
 
 
 def display_menu():
@@ -68,38 +67,56 @@ def display_menu():
     print()
 
 
-def display_team_stats(team_name, players):
-    """Display stats for a single team in a readable format."""
-    # Get player names as a comma-separated string
-    player_names = ", ".join([player['name'] for player in players])
-    
-    # Count experienced and inexperienced players
-    num_experienced = sum(1 for player in players if player['experience'])
-    num_inexperienced = sum(1 for player in players if not player['experience'])
-    
-    # Calculate average height
-    total_height = sum(player['height'] for player in players)
-    avg_height = total_height / len(players)
-    
-    # Get all guardians as a comma-separated string
+def get_team_stats(players):
+    """Compute the stats summary for a single team's roster."""
+    # Gather names, experience count, total height and guardians in one pass
+    names = []
     all_guardians = []
+    num_experienced = 0
+    total_height = 0
     for player in players:
+        names.append(player['name'])
         all_guardians.extend(player['guardians'])
-    guardians_string = ", ".join(all_guardians)
+        num_experienced += player['experience']  # booleans add as 0/1
+        total_height += player['height']
+    
+    # Join names and guardians into comma-separated strings
+    return TeamStats(
+        player_names=", ".join(names),
+        guardians=", ".join(all_guardians),
+        num_experienced=num_experienced,
+        num_inexperienced=len(players) - num_experienced,
+        avg_height=total_height / len(players),
+        total_players=len(players),
+    )
+
+
+def display_team_stats(team_name, players, stats_cache=None):
+    """
+    Display stats for a single team in a readable format.
+    If a stats_cache dict is given, the team's stats are computed on first
+    view and reused from the cache afterwards.
+    """
+    if stats_cache is None:
+        stats = get_team_stats(players)
+    else:
+        stats = stats_cache.get(team_name)
+        if stats is None:
+            stats = stats_cache[team_name] = get_team_stats(players)
     
     # Display the stats
     print("\n" + "=" * 50)
     print(f"  Team: {team_name}")
     print("=" * 50)
     
-    print(f"\n  Total Players: {len(players)}")
-    print(f"  Experienced: {num_experienced}")
-    print(f"  Inexperienced: {num_inexperienced}")
-    print(f"  Average Height: {avg_height:.1f} inches")
+    print(f"\n  Total Players: {stats.total_players}")
+    print(f"  Experienced: {stats.num_experienced}")
+    print(f"  Inexperienced: {stats.num_inexperienced}")
+    print(f"  Average Height: {stats.avg_height:.1f} inches")
     
-    print(f"\n  Players:\n  {player_names}")
+    print(f"\n  Players:\n  {stats.player_names}")
     
-    print(f"\n  Guardians:\n  {guardians_string}")
+    print(f"\n  Guardians:\n  {stats.guardians}")
     
     print("\n" + "-" * 50 + "\n")
 
@@ -111,6 +128,9 @@ def main():
     # Balance teams
     team_rosters = balance_teams(cleaned_players, TEAMS)
 
+    # Team stats are computed on first view and reused afterwards
+    team_stats_cache = {}
+
     while True:
         display_menu()
 
@@ -128,7 +148,7 @@ def main():
                 team_index = int(team_choice) - 1
                 if 0 <= team_index < len(TEAMS):
                     team_name = TEAMS[team_index]
-                    display_team_stats(team_name, team_rosters[team_name])
+                    display_team_stats(team_name, team_rosters[team_name], team_stats_cache)
                     input("\nPress ENTER to continue...")
                 else:
                     print("\n  Invalid team number!!! Please try again.\n")
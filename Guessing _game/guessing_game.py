@@ -24,35 +24,39 @@ def start_game():
 
         # Game loop: Continue until the player guesses correctly
         while True:
-            try:
-                # Prompt the player for their guess
-                guess = int(input("Enter your guess (a number between 1 and 100): "))
+            # Prompt the player for their guess
+            raw_guess = input("Enter your guess (a number between 1 and 100): ").strip()
 
-                # Ensure the guess is within the valid range
-                if guess < 1 or guess > 100:
-                    print("Out of range! Please enter a number between 1 and 100.")
-                    continue
+            # Validate the input up front instead of catching int() failures
+            digits = raw_guess[1:] if raw_guess.startswith(('+', '-')) else raw_guess
+            if not digits.isdecimal():
+                # Handle invalid inputs gracefully
+                print("Invalid input! Please enter a valid number between 1 and 100.")
+                continue
+            guess = int(raw_guess)
 
-                # Increment the attempt counter
-                attempts += 1
+            # Ensure the guess is within the valid range
+            if guess < 1 or guess > 100:
+                print("Out of range! Please enter a number between 1 and 100.")
+                continue
 
-                # Provide feedback: Too high, too low, or correct
-                if guess < solution:
-                    print("It's higher!")
-                elif guess > solution:
-                    print("It's lower!")
-                else:
-                    # Player guessed correctly
-                    print(f"Congratulations! You've guessed the correct number in {attempts} attempts.")
+            # Increment the attempt counter
+            attempts += 1
 
-                    # Update the high score if applicable
-                    if high_score is None or attempts < high_score:
-                        high_score = attempts
-                        print("You've set a new high score!")
-                    break
-            except ValueError:
-                # Handle invalid inputs gracefully
-                print("Invalid input! Please enter a valid number between 1 and 100.")
+            # Provide feedback: Too high, too low, or correct
+            if guess < solution:
+                print("It's higher!")
+            elif guess > solution:
+                print("It's lower!")
+            else:
+                # Player guessed correctly
+                print(f"Congratulations! You've guessed the correct number in {attempts} attempts.")
+
+                # Update the high score if applicable
+                if high_score is None or attempts < high_score:
+                    high_score = attempts
+                    print("You've set a new high score!")
+                break
 
         # Ask the player if they want to play again
         play_again_prompt = input("Would you like to play again? (Y/N): ").strip().upper()
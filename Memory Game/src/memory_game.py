@@ -1,3 +1,4 @@
+import functools
 import pygame
 import random
 import math
@@ -12,30 +13,42 @@ SCREEN_HEIGHT = 700
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Memory Match")
 
-# Colors
-BG_DARK = (15, 23, 42)
-BG_MEDIUM = (30, 41, 59)
-CARD_BLUE = (37, 99, 235)
-CARD_BLUE_LIGHT = (59, 130, 246)
-WHITE = (255, 255, 255)
-GRAY = (148, 163, 184)
-GREEN = (16, 185, 129)
-GREEN_LIGHT = (52, 211, 153)
-GREEN_BG = (6, 78, 59)
-RED = (239, 68, 68)
-PURPLE = (147, 51, 234)
-
-# Fonts
+# Colors (pygame.Color objects are passed to SDL without tuple conversion)
+BG_DARK = pygame.Color(15, 23, 42)
+BG_MEDIUM = pygame.Color(30, 41, 59)
+CARD_BLUE = pygame.Color(37, 99, 235)
+CARD_BLUE_LIGHT = pygame.Color(59, 130, 246)
+WHITE = pygame.Color(255, 255, 255)
+GRAY = pygame.Color(148, 163, 184)
+GREEN = pygame.Color(16, 185, 129)
+GREEN_LIGHT = pygame.Color(52, 211, 153)
+GREEN_BG = pygame.Color(6, 78, 59)
+RED = pygame.Color(239, 68, 68)
+PURPLE = pygame.Color(147, 51, 234)
+BORDER_LIGHT = pygame.Color(229, 231, 235)
+TEXT_DARK = pygame.Color(31, 41, 55)
+MATCHED_BG = pygame.Color(236, 253, 245)
+VICTORY_BG_BOTTOM = pygame.Color(6, 95, 70)
+
+# Fonts: probe the default font once, then build every size down one path
 try:
-    FONT_LARGE = pygame.font.Font(None, 72)
-    FONT_MEDIUM = pygame.font.Font(None, 48)
-    FONT_SMALL = pygame.font.Font(None, 36)
-    FONT_TINY = pygame.font.Font(None, 24)
-except:
-    FONT_LARGE = pygame.font.SysFont('arial', 54)
-    FONT_MEDIUM = pygame.font.SysFont('arial', 36)
-    FONT_SMALL = pygame.font.SysFont('arial', 27)
-    FONT_TINY = pygame.font.SysFont('arial', 18)
+    pygame.font.Font(None, 24)
+    _default_font_ok = True
+except (pygame.error, OSError):
+    _default_font_ok = False
+
+
+def make_font(size):
+    if _default_font_ok:
+        return pygame.font.Font(None, size)
+    # Arial renders larger than the default font, so scale it down
+    return pygame.font.SysFont('arial', int(size * 0.75))
+
+
+FONT_LARGE = make_font(72)
+FONT_MEDIUM = make_font(48)
+FONT_SMALL = make_font(36)
+FONT_TINY = make_font(24)
 
 # Card data
 SUITS = ['♠', '♥', '♦', '♣']
@@ -49,11 +62,58 @@ DIFFICULTIES = {
 }
 
 
+# Rendered text surfaces, keyed by (font, text, color), so static labels
+# and card faces are rasterized once instead of every frame
+_text_cache = {}
+
+
+def render_cached(font, text, color):
+    key = (font, text, tuple(color))  # pygame.Color is unhashable
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = _text_cache[key] = font.render(text, True, color).convert_alpha()
+    return surf
+
+
+@functools.lru_cache(maxsize=128)
+def rounded_rect_surf(width, height, radius, color, thickness):
+    """Rasterize a rounded rect once onto a colorkeyed surface for blitting."""
+    # Corners are either fully drawn or empty, so an RLE colorkey is enough
+    # and blits much faster than per-pixel alpha
+    key = (0, 0, 0) if color != (0, 0, 0) else (255, 255, 255)
+    surf = pygame.Surface((width, height)).convert()
+    surf.fill(key)
+    pygame.draw.rect(surf, color, surf.get_rect(), thickness, border_radius=radius)
+    surf.set_colorkey(key, pygame.RLEACCEL)
+    return surf
+
+
+def draw_rounded_rect(surface, color, rect, thickness=0, border_radius=0):
+    # Drawn straight onto the opaque screen the alpha channel is ignored,
+    # so cache on the RGB part (which also makes pygame.Color hashable)
+    surface.blit(rounded_rect_surf(rect.width, rect.height, border_radius,
+                                   tuple(color)[:3], thickness), rect)
+
+
+class CardFace:
+    """The immutable face of a pair, shared by both of its Card instances."""
+    __slots__ = ('rank_surf', 'suit_surf')
+
+    def __init__(self, rank, suit):
+        # Face glyphs never change, so rasterize them once per pair
+        color = RED if suit in ('♥', '♦') else TEXT_DARK
+        self.rank_surf = render_cached(FONT_MEDIUM, rank, color)
+        self.suit_surf = render_cached(FONT_SMALL, suit, color)
+
+
 class Card:
-    def __init__(self, rank, suit, pair_id, x, y, width, height):
-        self.rank = rank
-        self.suit = suit
-        self.pair_id = pair_id
+    # Fixed attribute set: no per-instance __dict__ and faster attribute access
+    __slots__ = ('face', 'x', 'y', 'width', 'height',
+                 'flipped', 'matched', 'flip_progress', 'flip_speed', 'target_flip',
+                 'rect', '_draw_fn')
+
+    def __init__(self, face, x, y, width, height):
+        self.face = face
         self.x = x
         self.y = y
         self.width = width
@@ -63,26 +123,44 @@ class Card:
         self.flip_progress = 0  # 0 = back, 1 = front
         self.flip_speed = 0.15
         self.target_flip = 0
+        self.rect = pygame.Rect(x, y, width, height)
         
-    def is_red(self):
-        return self.suit in ['♥', '♦']
+        # Resting cards take a fixed full-size path; only flips pay for scaling
+        self._draw_fn = self._draw_back_full
     
     def update(self):
-        # Animate flip
+        # Animate flip; returns True while the card is still mid-flip
         if self.flip_progress < self.target_flip:
             self.flip_progress = min(self.flip_progress + self.flip_speed, self.target_flip)
         elif self.flip_progress > self.target_flip:
             self.flip_progress = max(self.flip_progress - self.flip_speed, self.target_flip)
+        if self.flip_progress != self.target_flip:
+            return True
+        
+        # Flip finished: switch back to the static full-size drawing path
+        self._draw_fn = self._draw_front_full if self.target_flip else self._draw_back_full
+        return False
     
     def flip_to_front(self):
         self.target_flip = 1
         self.flipped = True
+        self._draw_fn = self._draw_flipping
         
     def flip_to_back(self):
         self.target_flip = 0
         self.flipped = False
+        self._draw_fn = self._draw_flipping
         
     def draw(self, surface):
+        self._draw_fn(surface)
+    
+    def _draw_front_full(self, surface):
+        self._draw_front(surface, self.rect, 1)
+    
+    def _draw_back_full(self, surface):
+        self._draw_back(surface, self.rect, 1)
+    
+    def _draw_flipping(self, surface):
         # Calculate flip scale (1 -> 0 -> 1 for flip effect)
         if self.flip_progress <= 0.5:
             scale = 1 - (self.flip_progress * 2)
@@ -98,57 +176,61 @@ class Card:
         rect = pygame.Rect(self.x + x_offset, self.y, scaled_width, self.height)
         
         if showing_front:
-            # Draw front of card
-            if self.matched:
-                bg_color = (236, 253, 245)
-                border_color = GREEN
-            else:
-                bg_color = WHITE
-                border_color = (229, 231, 235)
-            
-            pygame.draw.rect(surface, bg_color, rect, border_radius=8)
-            pygame.draw.rect(surface, border_color, rect, 2, border_radius=8)
-            
-            if self.matched:
-                # Glow effect
-                glow_rect = rect.inflate(6, 6)
-                pygame.draw.rect(surface, GREEN, glow_rect, 3, border_radius=10)
-            
-            # Draw rank and suit
-            if scale > 0.3:  # Only draw text when card is mostly visible
-                color = RED if self.is_red() else (31, 41, 55)
-                
-                # Rank
-                rank_text = FONT_MEDIUM.render(self.rank, True, color)
-                rank_rect = rank_text.get_rect(centerx=rect.centerx, centery=rect.centery - 15)
-                surface.blit(rank_text, rank_rect)
-                
-                # Suit
-                suit_text = FONT_SMALL.render(self.suit, True, color)
-                suit_rect = suit_text.get_rect(centerx=rect.centerx, centery=rect.centery + 20)
-                surface.blit(suit_text, suit_rect)
+            self._draw_front(surface, rect, scale)
+        else:
+            self._draw_back(surface, rect, scale)
+    
+    def _draw_front(self, surface, rect, scale):
+        # Draw front of card
+        if self.matched:
+            bg_color = MATCHED_BG
+            border_color = GREEN
         else:
-            # Draw back of card
-            pygame.draw.rect(surface, CARD_BLUE, rect, border_radius=8)
-            pygame.draw.rect(surface, CARD_BLUE_LIGHT, rect, 2, border_radius=8)
+            bg_color = WHITE
+            border_color = BORDER_LIGHT
+        
+        draw_rounded_rect(surface, bg_color, rect, border_radius=8)
+        draw_rounded_rect(surface, border_color, rect, 2, border_radius=8)
+        
+        if self.matched:
+            # Glow effect
+            glow_rect = rect.inflate(6, 6)
+            draw_rounded_rect(surface, GREEN, glow_rect, 3, border_radius=10)
+        
+        # Draw rank and suit
+        if scale > 0.3:  # Only draw text when card is mostly visible
+            face = self.face
             
-            # Inner border pattern
-            inner_rect = rect.inflate(-12, -12)
-            if inner_rect.width > 0 and inner_rect.height > 0:
-                pygame.draw.rect(surface, (255, 255, 255, 50), inner_rect, 1, border_radius=4)
+            # Rank
+            rank_rect = face.rank_surf.get_rect(centerx=rect.centerx, centery=rect.centery - 15)
+            surface.blit(face.rank_surf, rank_rect)
             
-            # Question mark
-            if scale > 0.3:
-                q_text = FONT_SMALL.render("?", True, (255, 255, 255, 100))
-                q_rect = q_text.get_rect(center=rect.center)
-                surface.blit(q_text, q_rect)
+            # Suit
+            suit_rect = face.suit_surf.get_rect(centerx=rect.centerx, centery=rect.centery + 20)
+            surface.blit(face.suit_surf, suit_rect)
     
-    def contains_point(self, pos):
-        return (self.x <= pos[0] <= self.x + self.width and 
-                self.y <= pos[1] <= self.y + self.height)
+    def _draw_back(self, surface, rect, scale):
+        # Draw back of card
+        draw_rounded_rect(surface, CARD_BLUE, rect, border_radius=8)
+        draw_rounded_rect(surface, CARD_BLUE_LIGHT, rect, 2, border_radius=8)
+        
+        # Inner border pattern
+        inner_rect = rect.inflate(-12, -12)
+        if inner_rect.width > 0 and inner_rect.height > 0:
+            draw_rounded_rect(surface, (255, 255, 255, 50), inner_rect, 1, border_radius=4)
+        
+        # Question mark
+        if scale > 0.3:
+            q_text = render_cached(FONT_SMALL, "?", (255, 255, 255, 100))
+            q_rect = q_text.get_rect(center=rect.center)
+            surface.blit(q_text, q_rect)
 
 
 class Button:
+    # difficulty_key / action are assigned by the screen that creates the button
+    __slots__ = ('rect', 'text', 'subtitle', 'color', 'hovered',
+                 'difficulty_key', 'action', '_surf_normal', '_surf_hovered')
+
     def __init__(self, x, y, width, height, text, subtitle=None, color=None):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
@@ -156,19 +238,24 @@ class Button:
         self.color = color or (255, 255, 255, 20)
         self.hovered = False
         
-    def draw(self, surface):
-        # Background
-        color = tuple(min(c + 20, 255) for c in self.color[:3]) if self.hovered else self.color
-        if len(color) == 3:
-            color = (*color, 255)
+        # Both background states are static, so render them once up front
+        self._surf_normal = self._render_background(False)
+        self._surf_hovered = self._render_background(True)
+        
+    def _render_background(self, hovered):
+        color = tuple(min(c + 20, 255) for c in self.color[:3]) if hovered else self.color
         
         # Create surface with alpha
         btn_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(btn_surface, (*color[:3], 30 if not self.hovered else 50), 
+        pygame.draw.rect(btn_surface, (*color[:3], 50 if hovered else 30), 
                         btn_surface.get_rect(), border_radius=12)
-        pygame.draw.rect(btn_surface, (*WHITE, 40), 
+        pygame.draw.rect(btn_surface, (*WHITE[:3], 40), 
                         btn_surface.get_rect(), 1, border_radius=12)
-        surface.blit(btn_surface, self.rect)
+        return btn_surface
+        
+    def draw(self, surface):
+        # Background
+        surface.blit(self._surf_hovered if self.hovered else self._surf_normal, self.rect)
         
         # Text
         text_surf = FONT_SMALL.render(self.text, True, WHITE)
@@ -190,7 +277,11 @@ class Button:
             surface.blit(arrow, arrow_rect)
     
     def update(self, mouse_pos):
-        self.hovered = self.rect.collidepoint(mouse_pos)
+        # Report whether the hover state changed so the caller knows to redraw
+        hovered = self.rect.collidepoint(mouse_pos)
+        changed = hovered != self.hovered
+        self.hovered = hovered
+        return changed
         
     def is_clicked(self, pos):
         return self.rect.collidepoint(pos)
@@ -202,6 +293,7 @@ class MemoryGame:
         self.difficulty = None
         self.cards = []
         self.flipped = []
+        self._animating = set()  # indices of cards currently mid-flip
         self.matched_count = 0
         self.attempts = 0
         self.start_time = 0
@@ -209,6 +301,8 @@ class MemoryGame:
         self.disabled = False
         self.disable_until = 0
         self.buttons = []
+        self._bg_cache = {}  # (color1, color2) -> pre-rendered gradient Surface
+        self.dirty = True  # menu/victory screens only redraw when something changed
         self.setup_menu()
         
     def setup_menu(self):
@@ -245,6 +339,7 @@ class MemoryGame:
         self.matched_count = 0
         self.attempts = 0
         self.flipped = []
+        self._animating = set()
         self.disabled = False
         self.start_time = time.time()
         
@@ -253,10 +348,12 @@ class MemoryGame:
         random.shuffle(all_cards)
         selected = all_cards[:config['pairs']]
         
+        # One shared face per pair; both cards of the pair reference it
         deck = []
-        for i, (rank, suit) in enumerate(selected):
-            deck.append((rank, suit, i))
-            deck.append((rank, suit, i))
+        for rank, suit in selected:
+            face = CardFace(rank, suit)
+            deck.append(face)
+            deck.append(face)
         random.shuffle(deck)
         
         # Calculate card layout
@@ -284,17 +381,37 @@ class MemoryGame:
         
         # Create card objects
         self.cards = []
-        for i, (rank, suit, pair_id) in enumerate(deck):
+        for i, face in enumerate(deck):
             row = i // cols
             col = i % cols
             x = start_x + col * (card_width + gap)
             y = start_y + row * (card_height + gap)
-            self.cards.append(Card(rank, suit, pair_id, x, y, card_width, card_height))
+            self.cards.append(Card(face, x, y, card_width, card_height))
+        
+        # Remember the grid layout so clicks can be mapped straight to a card
+        self.grid_x, self.grid_y = start_x, start_y
+        self.grid_cols, self.grid_rows = cols, rows
+        self.card_width, self.card_height = card_width, card_height
+        self.grid_gap = gap
         
         self.state = 'playing'
         self.buttons = []
         
+    def card_index_at(self, pos):
+        # Cards sit on a regular grid, so the cell under the cursor is plain
+        # arithmetic; a point in the gap between cards hits nothing
+        col, dx = divmod(pos[0] - self.grid_x, self.card_width + self.grid_gap)
+        row, dy = divmod(pos[1] - self.grid_y, self.card_height + self.grid_gap)
+        if (0 <= col < self.grid_cols and 0 <= row < self.grid_rows
+                and dx <= self.card_width and dy <= self.card_height):
+            index = row * self.grid_cols + col
+            if index < len(self.cards):
+                return index
+        return None
+        
     def handle_click(self, pos):
+        self.dirty = True
+        
         if self.state == 'menu':
             for btn in self.buttons:
                 if btn.is_clicked(pos):
@@ -303,7 +420,7 @@ class MemoryGame:
                     
         elif self.state == 'playing':
             # Back button
-            if pygame.Rect(20, 15, 80, 30).collidepoint(pos):
+            if 20 <= pos[0] < 100 and 15 <= pos[1] < 45:
                 self.state = 'menu'
                 self.setup_menu()
                 return
@@ -311,25 +428,28 @@ class MemoryGame:
             if self.disabled:
                 return
                 
-            for i, card in enumerate(self.cards):
-                if card.contains_point(pos) and not card.flipped and not card.matched:
-                    card.flip_to_front()
-                    self.flipped.append(i)
+            i = self.card_index_at(pos)
+            if i is None:
+                return
+            card = self.cards[i]
+            if not card.flipped and not card.matched:
+                card.flip_to_front()
+                self._animating.add(i)
+                self.flipped.append(i)
+                
+                if len(self.flipped) == 2:
+                    self.attempts += 1
+                    self.disabled = True
                     
-                    if len(self.flipped) == 2:
-                        self.attempts += 1
-                        self.disabled = True
-                        
-                        card1 = self.cards[self.flipped[0]]
-                        card2 = self.cards[self.flipped[1]]
-                        
-                        if card1.pair_id == card2.pair_id:
-                            # Match!
-                            self.disable_until = time.time() + 0.5
-                        else:
-                            # No match
-                            self.disable_until = time.time() + 0.9
-                    return
+                    card1 = self.cards[self.flipped[0]]
+                    card2 = self.cards[self.flipped[1]]
+                    
+                    if card1.face is card2.face:
+                        # Match!
+                        self.disable_until = time.time() + 0.5
+                    else:
+                        # No match
+                        self.disable_until = time.time() + 0.9
                     
         elif self.state == 'victory':
             for btn in self.buttons:
@@ -345,26 +465,31 @@ class MemoryGame:
         mouse_pos = pygame.mouse.get_pos()
         
         for btn in self.buttons:
-            btn.update(mouse_pos)
+            if btn.update(mouse_pos):
+                self.dirty = True
             
         if self.state == 'playing':
+            # The timer ticks and cards animate, so the board redraws every frame
+            self.dirty = True
             self.elapsed_time = time.time() - self.start_time
             
-            for card in self.cards:
-                card.update()
+            # Only cards mid-flip need animating; drop the ones that settled
+            if self._animating:
+                self._animating = {i for i in self._animating if self.cards[i].update()}
             
             # Check if disable period is over
             if self.disabled and time.time() >= self.disable_until:
                 card1 = self.cards[self.flipped[0]]
                 card2 = self.cards[self.flipped[1]]
                 
-                if card1.pair_id == card2.pair_id:
+                if card1.face is card2.face:
                     card1.matched = True
                     card2.matched = True
                     self.matched_count += 1
                 else:
                     card1.flip_to_back()
                     card2.flip_to_back()
+                    self._animating.update(self.flipped)
                 
                 self.flipped = []
                 self.disabled = False
@@ -375,10 +500,22 @@ class MemoryGame:
                     self.setup_victory_buttons()
     
     def draw_gradient_bg(self, color1, color2):
+        # The gradient is static, so render it once per color pair and blit after
+        key = (tuple(color1), tuple(color2))  # pygame.Color is unhashable
+        bg = self._bg_cache.get(key)
+        if bg is None:
+            bg = self._bg_cache[key] = self._render_gradient(color1, color2)
+        screen.blit(bg, (0, 0))
+    
+    def _render_gradient(self, color1, color2):
+        # Interpolate every row into one RGB byte column, then let pygame
+        # stretch that 1px column across the screen in C
+        column = bytearray()
         for y in range(SCREEN_HEIGHT):
             ratio = y / SCREEN_HEIGHT
-            color = tuple(int(color1[i] + (color2[i] - color1[i]) * ratio) for i in range(3))
-            pygame.draw.line(screen, color, (0, y), (SCREEN_WIDTH, y))
+            column.extend(int(color1[i] + (color2[i] - color1[i]) * ratio) for i in range(3))
+        strip = pygame.image.frombuffer(bytes(column), (1, SCREEN_HEIGHT), 'RGB')
+        return pygame.transform.scale(strip, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
     
     def draw_menu(self):
         self.draw_gradient_bg(BG_DARK, BG_MEDIUM)
@@ -411,11 +548,11 @@ class MemoryGame:
         stats_rect = pygame.Rect(50, 55, SCREEN_WIDTH - 100, 50)
         
         # Stats background
-        pygame.draw.rect(screen, (255, 255, 255), stats_rect, border_radius=10)
+        pygame.draw.rect(screen, WHITE, stats_rect, border_radius=10)
         
         # Progress bar
         progress_rect = pygame.Rect(stats_rect.x + 10, stats_rect.y + 8, stats_rect.width - 20, 6)
-        pygame.draw.rect(screen, (229, 231, 235), progress_rect, border_radius=3)
+        pygame.draw.rect(screen, BORDER_LIGHT, progress_rect, border_radius=3)
         
         progress = self.matched_count / config['pairs']
         if progress > 0:
@@ -429,13 +566,13 @@ class MemoryGame:
         # Matches
         matches_text = FONT_SMALL.render(f"{self.matched_count}/{config['pairs']}", True, GREEN)
         screen.blit(matches_text, matches_text.get_rect(centerx=stats_rect.x + stats_rect.width // 6, centery=stats_y))
-        matches_label = FONT_TINY.render("MATCHES", True, GRAY)
+        matches_label = render_cached(FONT_TINY, "MATCHES", GRAY)
         screen.blit(matches_label, matches_label.get_rect(centerx=stats_rect.x + stats_rect.width // 6, centery=stats_y + 18))
         
         # Attempts
         attempts_text = FONT_SMALL.render(str(self.attempts), True, CARD_BLUE)
         screen.blit(attempts_text, attempts_text.get_rect(centerx=stats_rect.centerx, centery=stats_y))
-        attempts_label = FONT_TINY.render("ATTEMPTS", True, GRAY)
+        attempts_label = render_cached(FONT_TINY, "ATTEMPTS", GRAY)
         screen.blit(attempts_label, attempts_label.get_rect(centerx=stats_rect.centerx, centery=stats_y + 18))
         
         # Time
@@ -444,7 +581,7 @@ class MemoryGame:
         time_str = f"{mins}:{secs:02d}"
         time_text = FONT_SMALL.render(time_str, True, PURPLE)
         screen.blit(time_text, time_text.get_rect(centerx=stats_rect.x + stats_rect.width * 5 // 6, centery=stats_y))
-        time_label = FONT_TINY.render("TIME", True, GRAY)
+        time_label = render_cached(FONT_TINY, "TIME", GRAY)
         screen.blit(time_label, time_label.get_rect(centerx=stats_rect.x + stats_rect.width * 5 // 6, centery=stats_y + 18))
         
         # Draw cards
@@ -452,7 +589,7 @@ class MemoryGame:
             card.draw(screen)
     
     def draw_victory(self):
-        self.draw_gradient_bg(GREEN_BG, (6, 95, 70))
+        self.draw_gradient_bg(GREEN_BG, VICTORY_BG_BOTTOM)
         
         config = DIFFICULTIES[self.difficulty]
         perfect = config['pairs']
@@ -528,11 +665,19 @@ def main():
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
                     game.handle_click(event.pos)
+            elif event.type == pygame.VIDEOEXPOSE:
+                game.dirty = True
         
         game.update()
-        game.draw()
-        pygame.display.flip()
-        clock.tick(60)
+        
+        # Static screens (menu/victory) are only redrawn when they change
+        if game.dirty:
+            game.draw()
+            pygame.display.flip()
+            game.dirty = False
+        
+        # Nothing animates off the board, so idle screens tick at half rate
+        clock.tick(60 if game.state == 'playing' else 30)
     
     pygame.quit()
 
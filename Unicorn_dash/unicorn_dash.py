@@ -11,6 +11,9 @@ import sys
 import math
 import json
 import os
+import array
+from functools import partial
+from itertools import islice
 
 # Initialize Pygame
 pygame.init()
@@ -63,6 +66,14 @@ SCREEN_HEIGHT = CONFIG['screen']['height']
 GROUND_HEIGHT = CONFIG['screen']['ground_height']
 FPS = CONFIG['screen']['fps']
 
+# Tuning values read every frame, looked up once
+COLLECTIBLE_SPAWN_CHANCE = CONFIG['collectibles']['spawn_chance']
+POWERUP_SPAWN_CHANCE = CONFIG['collectibles']['powerup_spawn_chance']
+SHIELD_DURATION = CONFIG['powerups']['shield_duration']
+MAGNET_DURATION = CONFIG['powerups']['magnet_duration']
+MAGNET_RANGE = CONFIG['powerups']['magnet_range']
+SHAKE_INTENSITY = CONFIG['effects']['screen_shake_intensity']
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (20, 20, 20)
@@ -143,6 +154,54 @@ DIFFICULTIES = {
 HIGH_SCORE_FILE = os.path.join(os.path.expanduser('~'), '.unicorn_dash_scores.json')
 
 
+# =============================================================================
+# SPRITE CACHE - Static vector art is drawn once and blitted afterwards
+# =============================================================================
+SPRITE_KEY = (255, 0, 255)  # transparent colorkey; no art uses pure magenta
+
+
+def bake_sprite(draw_fn, width, height, pad=40):
+    """Run draw_fn(surface, x, y) once offscreen and crop the result.
+    
+    Returns (sprite, (dx, dy)) where (dx, dy) is the sprite's offset from the
+    x, y the art is normally drawn at. The display mode must already be set.
+    """
+    canvas = pygame.Surface((width + pad * 2, height + pad * 2), pygame.SRCALPHA)
+    draw_fn(canvas, pad, pad)
+    bounds = canvas.get_bounding_rect()
+    
+    # The art is fully opaque, so an RLE colorkey blits much faster than
+    # per-pixel alpha
+    sprite = pygame.Surface(bounds.size).convert()
+    sprite.fill(SPRITE_KEY)
+    sprite.blit(canvas, (0, 0), bounds)
+    sprite.set_colorkey(SPRITE_KEY, pygame.RLEACCEL)
+    return sprite, (bounds.x - pad, bounds.y - pad)
+
+
+# Filled particle circles keyed by (color, radius); see dot_sprite
+_dot_sprites = {}
+
+
+def dot_sprite(color, radius):
+    """Return a cached sprite of a filled circle.
+    
+    Blitting it at (x - radius, y - radius) gives exactly the pixels of
+    pygame.draw.circle(screen, color, (x, y), radius), so particle layers can
+    draw every dot in one Surface.blits call.
+    """
+    key = (color, radius)
+    sprite = _dot_sprites.get(key)
+    if sprite is None:
+        size = radius * 2 + 1
+        sprite = pygame.Surface((size, size)).convert()
+        sprite.fill(SPRITE_KEY)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        sprite.set_colorkey(SPRITE_KEY, pygame.RLEACCEL)
+        _dot_sprites[key] = sprite
+    return sprite
+
+
 # =============================================================================
 # SOUND MANAGER - Generates procedural sounds using pygame
 # =============================================================================
@@ -185,49 +244,54 @@ class SoundManager:
     def _create_tone(self, sample_rate, duration, frequencies, wave_type='sine'):
         """Create a tone with frequency sweep"""
         n_samples = int(sample_rate * duration)
-        buf = []
-        
-        for i in range(n_samples):
-            t = i / sample_rate
-            # Interpolate frequency
-            freq_idx = min(int(t / duration * len(frequencies)), len(frequencies) - 1)
-            freq = frequencies[freq_idx]
+        n_freqs = len(frequencies)
+        
+        # The sweep holds each frequency for an equal slice of the tone. Find
+        # the first sample of each slice (with the same arithmetic the
+        # per-sample lookup used) so a slice is a single comprehension
+        def slice_start(k):
+            i = max(0, int(k * sample_rate * duration / n_freqs) - 2)
+            while int(i / sample_rate / duration * n_freqs) < k:
+                i += 1
+            return i
+        bounds = [slice_start(k) for k in range(n_freqs)] + [n_samples]
+        
+        sin = math.sin
+        floor = math.floor
+        buf = array.array('h')
+        for freq, start, end in zip(frequencies, bounds, bounds[1:]):
+            indices = range(start, end)
             
             # Generate waveform
-            if wave_type == 'sine':
-                sample = math.sin(2 * math.pi * freq * t)
-            elif wave_type == 'triangle':
-                sample = 2 * abs(2 * (t * freq - math.floor(t * freq + 0.5))) - 1
+            if wave_type == 'triangle':
+                wave = [2 * abs(2 * (t * freq - floor(t * freq + 0.5))) - 1
+                        for t in [i / sample_rate for i in indices]]
             elif wave_type == 'square':
-                sample = 1 if math.sin(2 * math.pi * freq * t) > 0 else -1
+                omega = 2 * math.pi * freq
+                wave = [1 if sin(omega * (i / sample_rate)) > 0 else -1 for i in indices]
             else:
-                sample = math.sin(2 * math.pi * freq * t)
+                omega = 2 * math.pi * freq
+                wave = [sin(omega * (i / sample_rate)) for i in indices]
             
-            # Apply envelope (fade out)
-            envelope = 1 - (i / n_samples)
-            sample = sample * envelope * 0.3
-            
-            # Convert to 16-bit
-            buf.append(int(sample * 32767))
+            # Apply envelope (fade out) and convert to 16-bit
+            buf.extend([int(sample * (1 - (i / n_samples)) * 0.3 * 32767)
+                        for i, sample in zip(indices, wave)])
         
         # Create sound from buffer
-        import array
-        sound_array = array.array('h', buf)
-        sound = pygame.mixer.Sound(buffer=sound_array)
+        sound = pygame.mixer.Sound(buffer=buf)
         sound.set_volume(self.sfx_volume)
         return sound
     
     def _create_noise(self, sample_rate, duration):
         """Create a short noise burst"""
         n_samples = int(sample_rate * duration)
-        buf = []
+        rand = random.random
         
-        for i in range(n_samples):
-            sample = random.uniform(-0.2, 0.2) * (1 - i / n_samples)
-            buf.append(int(sample * 32767))
-        
-        import array
-        sound_array = array.array('h', buf)
+        # White noise in [-0.2, 0.2) with a linear fade out, as 16-bit samples.
+        # -0.2 + 0.4 * rand() is exactly what random.uniform(-0.2, 0.2)
+        # computes, minus a method call per sample
+        sound_array = array.array('h', [int((-0.2 + 0.4 * rand()) * (1 - i / n_samples) * 32767)
+                                        for i in range(n_samples)])
         sound = pygame.mixer.Sound(buffer=sound_array)
         sound.set_volume(self.sfx_volume * 0.5)
         return sound
@@ -241,48 +305,100 @@ class SoundManager:
 # =============================================================================
 # PARTICLE EFFECTS
 # =============================================================================
-class Particle:
-    """Sparkle/magic particle effect"""
+class ParticleSystem:
+    """Sparkle/magic particle effects, stored column-wise.
     
-    def __init__(self, x, y, color=None):
-        self.x = x
-        self.y = y
-        self.color = color if color else random.choice([STAR_GOLD, SPARKLE_WHITE, UNICORN_PINK, UNICORN_PURPLE])
-        self.size = random.randint(2, 5)
-        self.life = random.randint(20, 40)
-        self.max_life = self.life
-        self.vx = random.uniform(-2, 0)
-        self.vy = random.uniform(-2, 2)
+    Every field lives in its own list (x, y, vx, ...), so a frame's update is a
+    few list comprehensions over all particles rather than one Python method
+    call per particle.
+    """
+    
+    SPARKLE_COLORS = [STAR_GOLD, SPARKLE_WHITE, UNICORN_PINK, UNICORN_PURPLE]
+    
+    def __init__(self):
+        self.x = []
+        self.y = []
+        self.vx = []
+        self.vy = []
+        self.life = []
+        self.max_life = []
+        self.size = []
+        self.color = []
+        # Columns are only ever updated in place, so this stays valid
+        self._columns = (self.x, self.y, self.vx, self.vy,
+                         self.life, self.max_life, self.size, self.color)
+        
+    def clear(self):
+        for column in self._columns:
+            column.clear()
+            
+    # Spawning runs many times per second, so integer picks are made as
+    # a + int(random() * n), which is several times cheaper than
+    # randint/choice and equally uniform
+    def spawn(self, x, y, color=None):
+        """Add a sparkle that drifts backwards"""
+        rand = random.random
+        color = color if color else self.SPARKLE_COLORS[int(rand() * len(self.SPARKLE_COLORS))]
+        size = 2 + int(rand() * 4)
+        life = 20 + int(rand() * 21)
+        self._add(x, y, random.uniform(-2, 0), random.uniform(-2, 2), life, size, color)
+        
+    def spawn_burst(self, x, y, color):
+        """Add a faster, shorter-lived particle for collecting items"""
+        rand = random.random
+        size = 2 + int(rand() * 4)
+        vx = random.uniform(-3, 3)
+        vy = random.uniform(-4, 1)
+        self._add(x, y, vx, vy, 15 + int(rand() * 16), size, color)
+        
+    def _add(self, x, y, vx, vy, life, size, color):
+        self.x.append(x)
+        self.y.append(y)
+        self.vx.append(vx)
+        self.vy.append(vy)
+        self.life.append(life)
+        self.max_life.append(life)
+        self.size.append(size)
+        self.color.append(color)
         
     def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.life -= 1
-        self.size = max(1, int(self.size * (self.life / self.max_life)))
-        
-    def draw(self, screen):
-        if self.size > 0:
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size)
-            
-    def is_dead(self):
-        return self.life <= 0
-
-
-class CollectParticle(Particle):
-    """Particle effect for collecting items"""
-    
-    def __init__(self, x, y, color):
-        super().__init__(x, y, color)
-        self.vx = random.uniform(-3, 3)
-        self.vy = random.uniform(-4, 1)
-        self.life = random.randint(15, 30)
-        self.max_life = self.life
+        life = self.life
+        if not life:
+            return
+        self.x[:] = [x + vx for x, vx in zip(self.x, self.vx)]
+        self.y[:] = [y + vy for y, vy in zip(self.y, self.vy)]
+        life[:] = [n - 1 for n in life]
+        self.size[:] = [max(1, int(size * (n / max_n)))
+                        for size, n, max_n in zip(self.size, life, self.max_life)]
+        
+        # Only a few particles expire per frame; delete them from every column
+        if min(life) <= 0:
+            dead = [i for i, n in enumerate(life) if n <= 0]
+            for column in self._columns:
+                for i in reversed(dead):
+                    del column[i]
+                
+    def draw(self, screen, palette=None):
+        """Draw every particle; palette optionally maps each color to another"""
+        colors = self.color if palette is None else [palette[color] for color in self.color]
+        # One batched blit of cached dots, in spawn order
+        screen.blits([(dot_sprite(color, size), (int(x) - size, int(y) - size))
+                      for x, y, size, color in zip(self.x, self.y, self.size, colors)],
+                     False)
 
 
 class RainbowTrail:
     """Rainbow trail segment behind unicorn"""
     
+    STRIPE_HEIGHT = 4
+    
+    # Pre-rendered stripe column per remaining life (fade level)
+    _strips = {}
+    
     def __init__(self, x, y):
+        self.reset(x, y)
+        
+    def reset(self, x, y):
         self.x = x
         self.y = y
         self.life = 30
@@ -292,17 +408,118 @@ class RainbowTrail:
         self.x -= speed * 0.5
         self.life -= 1
         
-    def draw(self, screen):
-        if self.life > 0:
-            alpha = self.life / self.max_life
-            height = 4
-            for i, color in enumerate(RAINBOW_COLORS):
-                y_pos = self.y + i * height - len(RAINBOW_COLORS) * height // 2
-                faded_color = tuple(int(c * alpha) for c in color)
-                pygame.draw.rect(screen, faded_color, (int(self.x), int(y_pos), 8, height))
+    def sprite(self):
+        """Return (surface, position) for this segment, ready for blit/blits"""
+        strip = RainbowTrail._strips.get(self.life)
+        if strip is None:
+            strip = RainbowTrail._strips[self.life] = self._render_strip()
+        top = int(self.y) - len(RAINBOW_COLORS) * self.STRIPE_HEIGHT // 2
+        return strip, (int(self.x), top)
+    
+    def _render_strip(self):
+        """Render the faded rainbow column for the current life"""
+        alpha = self.life / self.max_life
+        height = self.STRIPE_HEIGHT
+        strip = pygame.Surface((8, len(RAINBOW_COLORS) * height)).convert()
+        for i, color in enumerate(RAINBOW_COLORS):
+            faded_color = tuple(int(c * alpha) for c in color)
+            strip.fill(faded_color, (0, i * height, 8, height))
+        return strip
+
+
+class FireParticleSystem:
+    """Fire puffs trailing behind a dragon, stored column-wise like
+    ParticleSystem.
+    
+    Every puff starts with the same life, so puffs expire in the order they
+    were spawned and the dead ones are always at the front of the columns.
+    """
+    
+    LIFE = 15
+    
+    def __init__(self):
+        self.x = []
+        self.y = []
+        self.life = []
+        self.size = []
+        
+    def spawn(self, x, y):
+        self.x.append(x)
+        self.y.append(y - 5 + int(random.random() * 11))
+        self.life.append(self.LIFE)
+        self.size.append(3 + int(random.random() * 6))
+        
+    def update(self, speed):
+        life = self.life
+        if not life:
+            return
+        drift = speed * 0.5
+        self.x[:] = [x - drift for x in self.x]
+        life[:] = [n - 1 for n in life]
+        self.size[:] = [max(1, size - 0.3) for size in self.size]
+        
+        # Oldest first, so expired puffs form a prefix
+        dead = 0
+        for n in life:
+            if n > 0:
+                break
+            dead += 1
+        if dead:
+            for column in (self.x, self.y, life, self.size):
+                del column[:dead]
                 
-    def is_dead(self):
-        return self.life <= 0
+    def draw(self, screen):
+        batch = []
+        for x, y, life, size in zip(self.x, self.y, self.life, self.size):
+            size = int(size)
+            dot = dot_sprite(DRAGON_ORANGE if life > 8 else DRAGON_RED, size)
+            batch.append((dot, (int(x) - size, int(y) - size)))
+        screen.blits(batch, False)
+
+
+class ParticlePool:
+    """Reusable pool of short-lived effects (anything with reset/update/life).
+    
+    Live items are kept packed at the front of a preallocated list, in spawn
+    order (callers draw them in that order); dead ones are swapped behind
+    them and reused by the next spawn, so steady-state play allocates no new
+    effect objects.
+    """
+    
+    def __init__(self, item_class, capacity=64):
+        self.item_class = item_class
+        self._items = [item_class.__new__(item_class) for _ in range(capacity)]
+        self.count = 0
+        
+    def spawn(self, *args):
+        """Reset the next free item with args and mark it live"""
+        if self.count == len(self._items):
+            self._items.append(self.item_class.__new__(self.item_class))
+        item = self._items[self.count]
+        item.reset(*args)
+        self.count += 1
+        return item
+    
+    def update(self, *args):
+        """Update every live item, moving dead ones out of the live range"""
+        items = self._items
+        keep = 0
+        for i in range(self.count):
+            item = items[i]
+            item.update(*args)
+            if item.life > 0:
+                # Slide the live item down over the first dead slot; the dead
+                # item takes its place, so live items keep their order
+                items[i] = items[keep]
+                items[keep] = item
+                keep += 1
+        self.count = keep
+        
+    def clear(self):
+        self.count = 0
+        
+    def __iter__(self):
+        return islice(self._items, self.count)
 
 
 # =============================================================================
@@ -319,13 +536,16 @@ class Collectible:
         self.collected = False
         self.float_offset = random.random() * math.pi * 2
         self.rotation = 0
+        # Reused by get_rect every frame instead of allocating a new Rect
+        self._rect = pygame.Rect(0, 0, 0, 0)
         
     def update(self, speed):
         self.x -= speed
         self.rotation += 3
         
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        self._rect.update(self.x, self.y, self.width, self.height)
+        return self._rect
     
     def is_off_screen(self):
         return self.x + self.width < 0
@@ -334,32 +554,51 @@ class Collectible:
 class Star(Collectible):
     """Star collectible - worth more points"""
     
+    # Baked star shapes keyed by rotation; the star has 5-fold symmetry, so
+    # turning it by 72 degrees gives the same shape (24 frames at 3 deg/step)
+    _frames = {}
+    
+    # Glow circles keyed by (surface size, radius); the pulse only has a few
+    _glows = {}
+    
     def __init__(self, x, y):
         super().__init__(x, y)
         self.value = CONFIG['collectibles']['star_value']
         self.width = 30
         self.height = 30
         
-    def draw(self, screen):
+    def draw(self, screen, now_ms):
         x, y = int(self.x), int(self.y)
-        float_y = y + math.sin(pygame.time.get_ticks() * 0.008 + self.float_offset) * 5
+        float_y = y + math.sin(now_ms * 0.008 + self.float_offset) * 5
         
         # Draw glow
-        glow_size = 20 + math.sin(pygame.time.get_ticks() * 0.01) * 3
-        glow_surf = pygame.Surface((int(glow_size * 2), int(glow_size * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (255, 223, 0, 80), (int(glow_size), int(glow_size)), int(glow_size))
+        glow_size = 20 + math.sin(now_ms * 0.01) * 3
+        key = (int(glow_size * 2), int(glow_size))
+        glow_surf = Star._glows.get(key)
+        if glow_surf is None:
+            glow_surf = Star._glows[key] = pygame.Surface((key[0], key[0]), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surf, (255, 223, 0, 80), (key[1], key[1]), key[1])
         screen.blit(glow_surf, (x + self.width // 2 - glow_size, float_y + self.height // 2 - glow_size))
         
         # Draw star shape
         center_x = x + self.width // 2
         center_y = int(float_y) + self.height // 2
+        rotation = self.rotation % 72
+        frame = Star._frames.get(rotation)
+        if frame is None:
+            frame = Star._frames[rotation] = bake_sprite(
+                lambda surf, cx, cy: self._draw_shape(surf, cx, cy, rotation),
+                self.width, self.height)
+        star_surf, (dx, dy) = frame
+        screen.blit(star_surf, (center_x + dx, center_y + dy))
+        
+    def _draw_shape(self, screen, center_x, center_y, rotation):
+        """Draw the star's vector art at one rotation"""
         points = []
         for i in range(10):
-            angle = math.radians(i * 36 - 90 + self.rotation)
+            angle = math.radians(i * 36 - 90 + rotation)
             radius = 12 if i % 2 == 0 else 6
-            px = center_x + math.cos(angle) * radius
-            py = center_y + math.sin(angle) * radius
-            points.append((px, py))
+            points.append((center_x + math.cos(angle) * radius, center_y + math.sin(angle) * radius))
         
         pygame.draw.polygon(screen, STAR_GOLD, points)
         pygame.draw.polygon(screen, (255, 245, 200), points, 2)
@@ -368,22 +607,35 @@ class Star(Collectible):
 class Coin(Collectible):
     """Coin collectible - standard points"""
     
+    # Baked spin frames keyed by the coin's current width (4-25px)
+    _frames = {}
+    
     def __init__(self, x, y):
         super().__init__(x, y)
         self.value = CONFIG['collectibles']['coin_value']
         
-    def draw(self, screen):
+    def draw(self, screen, now_ms):
         x, y = int(self.x), int(self.y)
-        float_y = y + math.sin(pygame.time.get_ticks() * 0.008 + self.float_offset) * 4
+        float_y = y + math.sin(now_ms * 0.008 + self.float_offset) * 4
         
         # Spinning effect - width changes
-        spin = abs(math.sin(pygame.time.get_ticks() * 0.008))
+        spin = abs(math.sin(now_ms * 0.008))
         width = max(4, int(self.width * spin))
         
         center_x = x + self.width // 2
         center_y = int(float_y) + self.height // 2
         
         # Draw coin
+        frame = Coin._frames.get(width)
+        if frame is None:
+            frame = Coin._frames[width] = bake_sprite(
+                lambda surf, cx, cy: self._draw_shape(surf, cx, cy, width),
+                self.width, self.height)
+        coin_surf, (dx, dy) = frame
+        screen.blit(coin_surf, (center_x + dx, center_y + dy))
+        
+    def _draw_shape(self, screen, center_x, center_y, width):
+        """Draw the coin's vector art at one spin width"""
         pygame.draw.ellipse(screen, COIN_GOLD, (center_x - width // 2, center_y - 10, width, 20))
         if width > 8:
             pygame.draw.ellipse(screen, COIN_SHINE, (center_x - width // 4, center_y - 6, width // 2, 12), 2)
@@ -395,6 +647,9 @@ class Coin(Collectible):
 class PowerUp:
     """Base class for power-ups"""
     
+    # Full-strength glow circles keyed by (color, radius)
+    _glows = {}
+    
     def __init__(self, x, y, powerup_type):
         self.x = x
         self.y = y
@@ -403,34 +658,41 @@ class PowerUp:
         self.type = powerup_type
         self.float_offset = random.random() * math.pi * 2
         self.collected = False
+        self._rect = pygame.Rect(0, 0, 0, 0)
         
     def update(self, speed):
         self.x -= speed
         
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        self._rect.update(self.x, self.y, self.width, self.height)
+        return self._rect
     
     def is_off_screen(self):
         return self.x + self.width < 0
     
-    def draw(self, screen):
+    def draw(self, screen, now_ms):
         x, y = int(self.x), int(self.y)
-        float_y = y + math.sin(pygame.time.get_ticks() * 0.006 + self.float_offset) * 6
+        float_y = y + math.sin(now_ms * 0.006 + self.float_offset) * 6
         
         # Pulsing glow
-        pulse = abs(math.sin(pygame.time.get_ticks() * 0.008)) * 0.5 + 0.5
+        pulse = abs(math.sin(now_ms * 0.008)) * 0.5 + 0.5
         glow_size = int(25 + pulse * 10)
         
         if self.type == 'shield':
             color = SHIELD_BLUE
-            glow_color = (100, 180, 255, int(80 * pulse))
+            glow_color = (100, 180, 255)
         else:  # magnet
             color = MAGNET_RED
-            glow_color = (255, 100, 100, int(80 * pulse))
-        
-        # Draw glow
-        glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
+            glow_color = (255, 100, 100)
+        
+        # Draw glow: one opaque circle per color and size, faded by its
+        # surface alpha (blends exactly like drawing with that alpha)
+        key = (glow_color, glow_size)
+        glow_surf = PowerUp._glows.get(key)
+        if glow_surf is None:
+            glow_surf = PowerUp._glows[key] = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
+        glow_surf.set_alpha(int(80 * pulse))
         screen.blit(glow_surf, (x + self.width // 2 - glow_size, int(float_y) + self.height // 2 - glow_size))
         
         # Draw icon
@@ -464,6 +726,33 @@ class PowerUp:
 class Unicorn:
     """The player-controlled unicorn character"""
     
+    # Baked static poses: leg offsets -> body sprite, plus the ducking pose
+    _body_sprites = {}
+    _duck_sprite = None
+    
+    # Translucent overlays, created on first use instead of every frame
+    _horn_glow = None
+    _shield_surfs = {}  # full-strength shield bubble per unicorn height
+    
+    # Body oval vertices relative to the body center, computed once
+    _BODY_OFFSETS = tuple(
+        (math.cos(i * math.pi / 10) * 28, math.sin(i * math.pi / 10) * 18)
+        for i in range(20)
+    )
+    
+    # Mane strand corners relative to (x, y + 5 + mane offset), and the
+    # tail's three moving corners relative to (x, y) before the wave is
+    # added, flattened per strand as (color, x0, y0, x1, y1, ...)
+    _MANE_STRANDS = tuple(
+        (color, 60 - i * 6, i * 2, 45 - i * 6, 8 + i * 2, 40 - i * 8, 15 + i * 5,
+         45 - i * 6, 10 + i * 2, 55 - i * 6, 5 + i * 2)
+        for i, color in enumerate(MANE_COLORS)
+    )
+    _TAIL_STRANDS = tuple(
+        (color, -10 - i * 3, 35 + i * 4, -15 - i * 4, 45 + i * 5, -5 - i * 2, 40 + i * 3)
+        for i, color in enumerate(MANE_COLORS)
+    )
+    
     def __init__(self, difficulty):
         self.width = CONFIG['unicorn']['width']
         self.height = CONFIG['unicorn']['height']
@@ -476,12 +765,14 @@ class Unicorn:
         self.is_ducking = False
         self.jump_count = 0
         self.max_jumps = CONFIG['unicorn']['max_jumps']
-        self.difficulty = difficulty
+        self.set_difficulty(difficulty)
         self.leg_timer = 0
         self.leg_state = 0
         self.mane_offset = 0
-        self.particles = []
-        self.rainbow_trail = []
+        # Point buffer refilled in place for each live mane/tail strand
+        self._strand_pts = [[0, 0] for _ in range(5)]
+        self.particles = ParticleSystem()
+        self.rainbow_trail = ParticlePool(RainbowTrail)
         self.sparkle_timer = 0
         
         # Power-up states
@@ -497,8 +788,14 @@ class Unicorn:
         self.death_velocity_y = -10
         self.death_velocity_x = 2
         
+        # Reused by get_rect every frame instead of allocating a new Rect
+        self._rect = pygame.Rect(0, 0, 0, 0)
+        
     def set_difficulty(self, difficulty):
         self.difficulty = difficulty
+        # Physics constants are read every frame, so cache them here
+        self._gravity = DIFFICULTIES[difficulty]['gravity']
+        self._jump_strength = DIFFICULTIES[difficulty]['jump_strength']
         
     def jump(self, sound_manager=None):
         if self.is_dying:
@@ -509,7 +806,7 @@ class Unicorn:
             return False
             
         if self.jump_count < self.max_jumps:
-            self.velocity_y = DIFFICULTIES[self.difficulty]['jump_strength']
+            self.velocity_y = self._jump_strength
             self.is_jumping = True
             self.jump_count += 1
             
@@ -522,7 +819,7 @@ class Unicorn:
             
             # Burst of particles on jump
             for _ in range(10 if self.jump_count == 1 else 15):
-                self.particles.append(Particle(self.x + 20, self.y + self.height - 10))
+                self.particles.spawn(self.x + 20, self.y + self.height - 10)
             
             return True
         return False
@@ -550,13 +847,13 @@ class Unicorn:
         
     def activate_shield(self):
         self.shield_active = True
-        self.shield_timer = CONFIG['powerups']['shield_duration']
+        self.shield_timer = SHIELD_DURATION
         
     def activate_magnet(self):
         self.magnet_active = True
-        self.magnet_timer = CONFIG['powerups']['magnet_duration']
+        self.magnet_timer = MAGNET_DURATION
         
-    def update(self, game_speed):
+    def update(self, game_speed, now_ms, duck_held=False):
         # Death animation
         if self.is_dying:
             self.death_timer -= 1
@@ -567,8 +864,7 @@ class Unicorn:
             return
         
         # Apply gravity
-        gravity = DIFFICULTIES[self.difficulty]['gravity']
-        self.velocity_y += gravity
+        self.velocity_y += self._gravity
         self.y += self.velocity_y
         
         # Ground collision
@@ -580,7 +876,7 @@ class Unicorn:
             self.jump_count = 0
             
             # Auto stand up when landing
-            if self.is_ducking and not pygame.key.get_pressed()[pygame.K_DOWN]:
+            if self.is_ducking and not duck_held:
                 self.stand_up()
             
         # Animate legs
@@ -591,30 +887,26 @@ class Unicorn:
                 self.leg_state = (self.leg_state + 1) % 4
                 
         # Animate mane
-        self.mane_offset = math.sin(pygame.time.get_ticks() * 0.01) * 3
+        self.mane_offset = math.sin(now_ms * 0.01) * 3
         
         # Spawn particles
         self.sparkle_timer += 1
         if self.sparkle_timer > 3:
             self.sparkle_timer = 0
-            self.particles.append(Particle(
-                self.x + random.randint(20, 50),
-                self.y + random.randint(10, 40)
-            ))
+            self.particles.spawn(
+                self.x + 20 + int(random.random() * 31),
+                self.y + 10 + int(random.random() * 31)
+            )
             
         # Rainbow trail when running
         if not self.is_jumping and random.random() < 0.3:
-            self.rainbow_trail.append(RainbowTrail(self.x, self.y + self.height // 2))
+            self.rainbow_trail.spawn(self.x, self.y + self.height // 2)
             
         # Update particles
-        for p in self.particles:
-            p.update()
-        self.particles = [p for p in self.particles if not p.is_dead()]
+        self.particles.update()
         
         # Update rainbow trail
-        for r in self.rainbow_trail:
-            r.update(game_speed)
-        self.rainbow_trail = [r for r in self.rainbow_trail if not r.is_dead()]
+        self.rainbow_trail.update(game_speed)
         
         # Update power-up timers
         if self.shield_active:
@@ -627,7 +919,7 @@ class Unicorn:
             if self.magnet_timer <= 0:
                 self.magnet_active = False
                 
-    def draw(self, screen):
+    def draw(self, screen, now_ms):
         x, y = int(self.x), int(self.y)
         
         # Apply death rotation if dying
@@ -635,27 +927,30 @@ class Unicorn:
             self._draw_dying(screen, x, y)
             return
         
-        # Draw rainbow trail first (behind unicorn)
-        for r in self.rainbow_trail:
-            r.draw(screen)
+        # Draw rainbow trail first (behind unicorn), batched into one call
+        screen.blits([r.sprite() for r in self.rainbow_trail if r.life > 0], False)
         
         # Draw particles
-        for p in self.particles:
-            p.draw(screen)
+        self.particles.draw(screen)
         
         # Draw shield effect if active
         if self.shield_active:
-            shield_alpha = 100 + int(50 * math.sin(pygame.time.get_ticks() * 0.02))
-            shield_surf = pygame.Surface((self.width + 30, self.height + 30), pygame.SRCALPHA)
-            pygame.draw.ellipse(shield_surf, (100, 180, 255, shield_alpha), 
-                              (0, 0, self.width + 30, self.height + 30))
+            shield_alpha = 100 + int(50 * math.sin(now_ms * 0.02))
+            # The bubble follows the current height (standing or ducking)
+            shield_surf = Unicorn._shield_surfs.get(self.height)
+            if shield_surf is None:
+                shield_surf = pygame.Surface((self.width + 30, self.height + 30), pygame.SRCALPHA)
+                pygame.draw.ellipse(shield_surf, (100, 180, 255), 
+                                  (0, 0, self.width + 30, self.height + 30))
+                Unicorn._shield_surfs[self.height] = shield_surf
+            shield_surf.set_alpha(shield_alpha)
             screen.blit(shield_surf, (x - 15, y - 15))
         
         # Draw the unicorn (normal or ducking)
         if self.is_ducking:
             self._draw_ducking(screen, x, y)
         else:
-            self._draw_normal(screen, x, y)
+            self._draw_normal(screen, x, y, now_ms)
             
     def _draw_dying(self, screen, x, y):
         """Draw unicorn during death animation"""
@@ -682,15 +977,22 @@ class Unicorn:
         
         # Falling particles
         if random.random() < 0.5:
-            self.particles.append(Particle(x + random.randint(0, self.width), 
-                                          y + random.randint(0, self.height),
-                                          UNICORN_PINK))
+            self.particles.spawn(x + random.randint(0, self.width), 
+                                 y + random.randint(0, self.height),
+                                 UNICORN_PINK)
         
-        for p in self.particles:
-            p.draw(screen)
+        self.particles.draw(screen)
             
     def _draw_ducking(self, screen, x, y):
         """Draw unicorn in ducking pose"""
+        # The ducking pose never animates, so it is baked once
+        if Unicorn._duck_sprite is None:
+            Unicorn._duck_sprite = bake_sprite(self._draw_ducking_shape, self.width, self.duck_height)
+        sprite, (dx, dy) = Unicorn._duck_sprite
+        screen.blit(sprite, (x + dx, y + dy))
+        
+    def _draw_ducking_shape(self, screen, x, y):
+        """Draw the ducking pose's vector art"""
         # Flattened body
         pygame.draw.ellipse(screen, UNICORN_WHITE, (x + 5, y + 5, 60, 25))
         
@@ -717,15 +1019,64 @@ class Unicorn:
         for i, color in enumerate(MANE_COLORS[:3]):
             pygame.draw.ellipse(screen, color, (x + 35 - i * 8, y + 2, 12, 10))
             
-    def _draw_normal(self, screen, x, y):
+    def _draw_normal(self, screen, x, y, now_ms):
         """Draw unicorn in normal pose"""
+        if self.is_jumping:
+            leg_offsets = (-8, -8, 8, 8)
+        elif self.leg_state == 0:
+            leg_offsets = (-5, 5, 5, -5)
+        elif self.leg_state == 2:
+            leg_offsets = (5, -5, -5, 5)
+        else:
+            leg_offsets = (0, 0, 0, 0)
+        
+        # Body, legs, head, horn and ear only change with the leg pose, so
+        # each pose is baked once; mane, tail and glow animate and stay live
+        sprite = Unicorn._body_sprites.get(leg_offsets)
+        if sprite is None:
+            sprite = Unicorn._body_sprites[leg_offsets] = bake_sprite(
+                lambda surf, bx, by: self._draw_body(surf, bx, by, leg_offsets),
+                self.width, self.normal_height)
+        body_surf, (dx, dy) = sprite
+        screen.blit(body_surf, (x + dx, y + dy))
+        
+        # Horn glow
+        horn_tip = (x + 85, y - 25)
+        if Unicorn._horn_glow is None:
+            Unicorn._horn_glow = pygame.Surface((20, 20), pygame.SRCALPHA)
+            pygame.draw.circle(Unicorn._horn_glow, (255, 215, 0, 50), (10, 10), 10)
+        screen.blit(Unicorn._horn_glow, (int(horn_tip[0]) - 10, int(horn_tip[1]) - 10))
+        
+        # === MANE ===
+        mane_y = y + 5 + self.mane_offset
+        points = self._strand_pts
+        p0, p1, p2, p3, p4 = points
+        polygon = pygame.draw.polygon
+        for color, x0, y0, x1, y1, x2, y2, x3, y3, x4, y4 in Unicorn._MANE_STRANDS:
+            p0[0], p0[1] = x + x0, mane_y + y0
+            p1[0], p1[1] = x + x1, mane_y + y1
+            p2[0], p2[1] = x + x2, mane_y + y2
+            p3[0], p3[1] = x + x3, mane_y + y3
+            p4[0], p4[1] = x + x4, mane_y + y4
+            polygon(screen, color, points)
+            
+        # === TAIL ===
+        tail_wave = math.sin(now_ms * 0.008) * 5
+        wave_tip = tail_wave * 1.5
+        wave_half = tail_wave * 0.5
+        p0[0], p0[1] = x + 8, y + 30
+        p4[0], p4[1] = x + 5, y + 35
+        for color, x1, y1, x2, y2, x3, y3 in Unicorn._TAIL_STRANDS:
+            p1[0], p1[1] = x + x1 + tail_wave, y + y1
+            p2[0], p2[1] = x + x2 + wave_tip, y + y2
+            p3[0], p3[1] = x + x3 + wave_half, y + y3
+            polygon(screen, color, points)
+            
+    def _draw_body(self, screen, x, y, leg_offsets):
+        """Draw the static parts of the normal pose (everything but mane, tail and glow)"""
         # === BODY ===
-        body_points = []
-        for i in range(20):
-            angle = i * math.pi / 10
-            bx = x + 35 + math.cos(angle) * 28
-            by = y + 35 + math.sin(angle) * 18
-            body_points.append((bx, by))
+        cx, cy = x + 35, y + 35
+        body_points = [(cx + dx, cy + dy) for dx, dy in Unicorn._BODY_OFFSETS]
         pygame.draw.polygon(screen, UNICORN_WHITE, body_points)
         pygame.draw.polygon(screen, UNICORN_CREAM, body_points, 2)
         
@@ -737,19 +1088,6 @@ class Unicorn:
             (x + 58, y + 45),
         ]
         
-        leg_offsets = [0, 0, 0, 0]
-        if not self.is_jumping:
-            if self.leg_state == 0:
-                leg_offsets = [-5, 5, 5, -5]
-            elif self.leg_state == 1:
-                leg_offsets = [0, 0, 0, 0]
-            elif self.leg_state == 2:
-                leg_offsets = [5, -5, -5, 5]
-            else:
-                leg_offsets = [0, 0, 0, 0]
-        else:
-            leg_offsets = [-8, -8, 8, 8]
-            
         for i, (lx, ly) in enumerate(leg_positions):
             pygame.draw.rect(screen, UNICORN_WHITE, (lx, ly + leg_offsets[i], 6, 18))
             pygame.draw.ellipse(screen, UNICORN_PINK, (lx - 1, ly + 16 + leg_offsets[i], 8, 6))
@@ -784,37 +1122,6 @@ class Unicorn:
             hy = horn_base[1] - i * 5
             hx = horn_base[0] + i * 2
             pygame.draw.line(screen, (255, 245, 0), (hx - 3 + i, hy), (hx + 2 - i * 0.5, hy - 2), 1)
-        
-        # Horn glow
-        glow_surf = pygame.Surface((20, 20), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (255, 215, 0, 50), (10, 10), 10)
-        screen.blit(glow_surf, (int(horn_tip[0]) - 10, int(horn_tip[1]) - 10))
-        
-        # === MANE ===
-        mane_y_offset = self.mane_offset
-        for i, color in enumerate(MANE_COLORS):
-            mane_x = x + 50 - i * 6
-            mane_y = y + 5 + mane_y_offset + i * 2
-            points = [
-                (mane_x + 10, mane_y),
-                (mane_x - 5, mane_y + 8),
-                (mane_x - 10 - i * 2, mane_y + 15 + i * 3),
-                (mane_x - 5, mane_y + 10),
-                (mane_x + 5, mane_y + 5)
-            ]
-            pygame.draw.polygon(screen, color, points)
-            
-        # === TAIL ===
-        tail_wave = math.sin(pygame.time.get_ticks() * 0.008) * 5
-        for i, color in enumerate(MANE_COLORS):
-            tail_points = [
-                (x + 8, y + 30),
-                (x - 10 - i * 3 + tail_wave, y + 35 + i * 4),
-                (x - 15 - i * 4 + tail_wave * 1.5, y + 45 + i * 5),
-                (x - 5 - i * 2 + tail_wave * 0.5, y + 40 + i * 3),
-                (x + 5, y + 35)
-            ]
-            pygame.draw.polygon(screen, color, tail_points)
             
         # === EAR ===
         ear_points = [(x + 68, y - 2), (x + 72, y - 12), (x + 76, y - 2)]
@@ -824,8 +1131,10 @@ class Unicorn:
     def get_rect(self):
         """Return collision rectangle (adjusted for fairness)"""
         if self.is_ducking:
-            return pygame.Rect(self.x + 10, self.y + 5, self.width - 15, self.height - 5)
-        return pygame.Rect(self.x + 15, self.y + 10, self.width - 25, self.height - 15)
+            self._rect.update(self.x + 10, self.y + 5, self.width - 15, self.height - 5)
+        else:
+            self._rect.update(self.x + 15, self.y + 10, self.width - 25, self.height - 15)
+        return self._rect
 
 
 # =============================================================================
@@ -834,6 +1143,10 @@ class Unicorn:
 class Rock:
     """Rock obstacle"""
     
+    # Baked rock art per variant (the crystal's pulsing glow stays live)
+    _sprites = {}
+    _crystal_glow = None
+    
     def __init__(self, x, variant=None):
         self.variant = variant if variant else random.choice(['small', 'medium', 'large', 'crystal'])
         
@@ -853,24 +1166,44 @@ class Rock:
         self.x = x
         self.y = SCREEN_HEIGHT - GROUND_HEIGHT - self.height
         self.glow_offset = random.random() * math.pi * 2
+        self._rect = pygame.Rect(0, 0, 0, 0)
         
     def update(self, speed):
         self.x -= speed
         
-    def draw(self, screen):
+    def draw(self, screen, now_ms):
         x, y = int(self.x), int(self.y)
         
         if self.variant == 'crystal':
-            glow = abs(math.sin(pygame.time.get_ticks() * 0.005 + self.glow_offset)) * 0.5 + 0.5
-            
-            glow_surf = pygame.Surface((self.width + 20, self.height + 20), pygame.SRCALPHA)
-            pygame.draw.polygon(glow_surf, (148, 0, 211, int(50 * glow)), [
-                (self.width // 2 + 10, 5),
-                (5, self.height + 10),
-                (self.width + 15, self.height + 10)
-            ])
-            screen.blit(glow_surf, (x - 10, y - 10))
+            glow = abs(math.sin(now_ms * 0.005 + self.glow_offset)) * 0.5 + 0.5
             
+            # One full-strength glow, faded per frame by its surface alpha
+            if Rock._crystal_glow is None:
+                Rock._crystal_glow = pygame.Surface((self.width + 20, self.height + 20), pygame.SRCALPHA)
+                pygame.draw.polygon(Rock._crystal_glow, (148, 0, 211), [
+                    (self.width // 2 + 10, 5),
+                    (5, self.height + 10),
+                    (self.width + 15, self.height + 10)
+                ])
+            Rock._crystal_glow.set_alpha(int(50 * glow))
+            screen.blit(Rock._crystal_glow, (x - 10, y - 10))
+        
+        screen.blit(*self.sprite())
+        
+    def sprite(self):
+        """Return (surface, position) of the rock body, ready for blit/blits.
+        
+        For every variant but the crystal this is the whole drawing.
+        """
+        sprite = Rock._sprites.get(self.variant)
+        if sprite is None:
+            sprite = Rock._sprites[self.variant] = bake_sprite(self._draw_shape, self.width, self.height)
+        rock_surf, (dx, dy) = sprite
+        return rock_surf, (int(self.x) + dx, int(self.y) + dy)
+        
+    def _draw_shape(self, screen, x, y):
+        """Draw the rock's static vector art"""
+        if self.variant == 'crystal':
             pygame.draw.polygon(screen, CRYSTAL_PURPLE, [
                 (x + self.width // 2, y),
                 (x, y + self.height),
@@ -885,7 +1218,8 @@ class Rock:
                            (x + self.width // 2, y + 5), 
                            (x + self.width // 3, y + self.height // 2), 2)
         else:
-            pygame.draw.ellipse(screen, (50, 50, 50, 100), 
+            # Shadow (alpha was always ignored on the opaque screen)
+            pygame.draw.ellipse(screen, (50, 50, 50), 
                               (x - 5, y + self.height - 10, self.width + 10, 15))
             
             rock_points = [
@@ -915,7 +1249,8 @@ class Rock:
                            (x + self.width * 0.7, y + self.height * 0.6), 2)
             
     def get_rect(self):
-        return pygame.Rect(self.x + 5, self.y + 10, self.width - 10, self.height - 10)
+        self._rect.update(self.x + 5, self.y + 10, self.width - 10, self.height - 10)
+        return self._rect
     
     def is_off_screen(self):
         return self.x + self.width < 0
@@ -924,6 +1259,12 @@ class Rock:
 class Dragon:
     """Flying dragon obstacle - can be ducked under at certain heights"""
     
+    # Baked dragon per whole-pixel wing offset. Polygon and line corners
+    # are floored when drawn, so the wing only ever takes 16 shapes
+    _frames = {}
+    
+    WING_SWING = math.pi / 6  # wing flap amplitude (30 degrees)
+    
     def __init__(self, x, force_high=False):
         self.width = 60
         self.height = 40
@@ -943,35 +1284,38 @@ class Dragon:
             self.can_duck_under = self.y >= SCREEN_HEIGHT - GROUND_HEIGHT - 70
             
         self.wing_timer = 0
-        self.wing_angle = 0
-        self.fire_particles = []
+        self.wing_y_offset = 0
+        self.fire_particles = FireParticleSystem()
+        self._rect = pygame.Rect(0, 0, 0, 0)
         
     def update(self, speed):
         self.x -= speed * 1.3
         self.wing_timer += 1
-        self.wing_angle = math.sin(self.wing_timer * 0.3) * 30
+        # Wing angle in radians, kept only as the tip's whole-pixel lift
+        wing_angle = math.sin(self.wing_timer * 0.3) * self.WING_SWING
+        self.wing_y_offset = math.floor(math.sin(wing_angle) * 15)
         
         if random.random() < 0.3:
-            self.fire_particles.append({
-                'x': self.x - 10,
-                'y': self.y + 20 + random.randint(-5, 5),
-                'life': 15,
-                'size': random.randint(3, 8)
-            })
+            self.fire_particles.spawn(self.x - 10, self.y + 20)
             
-        for p in self.fire_particles:
-            p['x'] -= speed * 0.5
-            p['life'] -= 1
-            p['size'] = max(1, p['size'] - 0.3)
-        self.fire_particles = [p for p in self.fire_particles if p['life'] > 0]
+        self.fire_particles.update(speed)
             
-    def draw(self, screen):
+    def draw(self, screen, now_ms):
         x, y = int(self.x), int(self.y)
         
-        for p in self.fire_particles:
-            color = DRAGON_ORANGE if p['life'] > 8 else DRAGON_RED
-            pygame.draw.circle(screen, color, (int(p['x']), int(p['y'])), int(p['size']))
+        self.fire_particles.draw(screen)
         
+        wing_y_offset = self.wing_y_offset
+        frame = Dragon._frames.get(wing_y_offset)
+        if frame is None:
+            frame = Dragon._frames[wing_y_offset] = bake_sprite(
+                lambda surf, fx, fy: self._draw_shape(surf, fx, fy, wing_y_offset),
+                self.width, self.height)
+        dragon_surf, (dx, dy) = frame
+        screen.blit(dragon_surf, (x + dx, y + dy))
+        
+    def _draw_shape(self, screen, x, y, wing_y_offset):
+        """Draw the dragon's vector art with the wing at one offset"""
         pygame.draw.ellipse(screen, DRAGON_RED, (x + 15, y + 15, 35, 20))
         pygame.draw.ellipse(screen, DRAGON_RED, (x + 40, y + 10, 22, 18))
         pygame.draw.ellipse(screen, DRAGON_RED, (x + 55, y + 15, 12, 10))
@@ -986,19 +1330,6 @@ class Dragon:
             (x + 52, y + 10), (x + 52, y + 2), (x + 56, y + 10)
         ])
         
-        wing_y_offset = math.sin(math.radians(self.wing_angle)) * 15
-        
-        wing_points = [
-            (x + 25, y + 15),
-            (x + 15, y - 10 + wing_y_offset),
-            (x + 35, y - 5 + wing_y_offset),
-            (x + 40, y + 15)
-        ]
-        pygame.draw.polygon(screen, DRAGON_ORANGE, wing_points)
-        
-        pygame.draw.line(screen, DRAGON_RED, (x + 25, y + 15), (x + 20, y - 5 + wing_y_offset), 2)
-        pygame.draw.line(screen, DRAGON_RED, (x + 30, y + 15), (x + 30, y - 3 + wing_y_offset), 2)
-        
         tail_points = [
             (x + 15, y + 22),
             (x, y + 18),
@@ -1015,8 +1346,17 @@ class Dragon:
         pygame.draw.ellipse(screen, DRAGON_RED, (x + 20, y + 30, 8, 12))
         pygame.draw.ellipse(screen, DRAGON_RED, (x + 35, y + 30, 8, 12))
         
+        # Wing
+        pygame.draw.polygon(screen, DRAGON_ORANGE, [
+            (x + 25, y + 15), (x + 15, y - 10 + wing_y_offset),
+            (x + 35, y - 5 + wing_y_offset), (x + 40, y + 15)
+        ])
+        pygame.draw.line(screen, DRAGON_RED, (x + 25, y + 15), (x + 20, y - 5 + wing_y_offset), 2)
+        pygame.draw.line(screen, DRAGON_RED, (x + 30, y + 15), (x + 30, y - 3 + wing_y_offset), 2)
+        
     def get_rect(self):
-        return pygame.Rect(self.x + 10, self.y + 10, self.width - 15, self.height - 15)
+        self._rect.update(self.x + 10, self.y + 10, self.width - 15, self.height - 15)
+        return self._rect
     
     def is_off_screen(self):
         return self.x + self.width < 0
@@ -1028,6 +1368,9 @@ class Dragon:
 class Cloud:
     """Background cloud decoration"""
     
+    # Baked cloud art per (size, color)
+    _sprites = {}
+    
     def __init__(self, x=None):
         self.x = x if x else random.randint(SCREEN_WIDTH, SCREEN_WIDTH + 300)
         self.y = random.randint(40, 150)
@@ -1042,9 +1385,17 @@ class Cloud:
     def update(self):
         self.x -= self.speed
         
-    def draw(self, screen):
-        x, y = int(self.x), int(self.y)
-        
+    def sprite(self):
+        """Return (surface, position) for this cloud, ready for blit/blits"""
+        key = (self.size, self.color)
+        sprite = Cloud._sprites.get(key)
+        if sprite is None:
+            sprite = Cloud._sprites[key] = bake_sprite(self._draw_shape, 150, 40)
+        cloud_surf, (dx, dy) = sprite
+        return cloud_surf, (int(self.x) + dx, int(self.y) + dy)
+        
+    def _draw_shape(self, screen, x, y):
+        """Draw the cloud's vector art"""
         if self.size == 'small':
             pygame.draw.ellipse(screen, self.color, (x, y, 50, 25))
             pygame.draw.ellipse(screen, self.color, (x + 20, y - 10, 35, 30))
@@ -1066,16 +1417,22 @@ class Cloud:
 class BackgroundStar:
     """Background twinkling star (renamed to avoid conflict with collectible Star)"""
     
+    # One twinkle cycle (a half sine wave, ~1s) as 256 gray levels
+    _TWINKLE = [(int(255 * math.sin(math.pi * i / 256)),) * 3 for i in range(256)]
+    
     def __init__(self):
         self.x = random.randint(0, SCREEN_WIDTH)
         self.y = random.randint(20, 180)
-        self.twinkle_offset = random.random() * math.pi * 2
+        self.twinkle_phase = int(random.random() * 512) & 255
         self.size = random.randint(1, 3)
-        
-    def draw(self, screen):
-        brightness = abs(math.sin(pygame.time.get_ticks() * 0.003 + self.twinkle_offset))
-        color = tuple(int(255 * brightness) for _ in range(3))
-        pygame.draw.circle(screen, color, (self.x, self.y), self.size)
+        # Stars never move, so the dot sprite always lands at the same spot
+        self.pos = (self.x - self.size, self.y - self.size)
+        
+    def draw(self, screen, now_ms, palette=None):
+        """Draw the star; palette replaces the twinkle colors (same length)"""
+        palette = palette or self._TWINKLE
+        color = palette[((now_ms >> 2) + self.twinkle_phase) & 255]
+        screen.blit(dot_sprite(color, self.size), self.pos)
 
 
 # =============================================================================
@@ -1084,14 +1441,51 @@ class BackgroundStar:
 class Game:
     """Main game class with all improvements"""
     
+    GRASS_MARGIN = 20        # room above the ground line for grass blades
+    PEBBLE_ROWS = (20, 45)   # ground rows (from the top) covered by pebbles
+    TEXT_CACHE_SIZE = 128    # rendered text surfaces kept by _text
+    OFFSCREEN_MARGIN = 40    # max reach of glows/fire left of an entity's x
+    TITLE_Y = 60             # menu layout rows
+    TITLE_FRAMES = 32        # wobble phases pre-composed for the menu title
+    SHAKE_OFFSETS = 64       # random screen-shake offsets drawn at startup
+    DIFFICULTY_Y = 220
+    INSTRUCTIONS_Y = 390
+    
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("🦄 Unicorn Dash Enhanced - Magical Endless Runner!")
         self.clock = pygame.time.Clock()
         
+        # The game is keyboard-only; keep mouse and text events out of the
+        # queue so handle_events never has to build and skip them
+        pygame.event.set_blocked([
+            pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+            pygame.MOUSEWHEEL, pygame.TEXTINPUT, pygame.TEXTEDITING,
+            pygame.FINGERMOTION, pygame.FINGERDOWN, pygame.FINGERUP,
+        ])
+        
         # Pre-render sky gradient for optimization
         self.sky_surface = self._create_sky_gradient()
         
+        # Offscreen frame used only while the screen shakes
+        self._shake_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        
+        # Pre-render the scrolling ground layers
+        self._create_ground_strips()
+        
+        # Full-screen tints for the menu, game over and pause screens
+        self._menu_overlay = self._create_overlay((255, 240, 245), 120)
+        self._game_over_overlay = self._create_overlay((255, 240, 245), 180)
+        self._pause_overlay = self._create_overlay((100, 100, 150), 150)
+        
+        # Menu art as it looks under the menu overlay (see draw_menu)
+        self._menu_background = None
+        self._menu_background_offset = None
+        self._menu_tints = {}
+        self._menu_twinkle = [self._menu_tint(color) for color in BackgroundStar._TWINKLE]
+        self._menu_sparkles = {color: self._menu_tint(color)
+                               for color in ParticleSystem.SPARKLE_COLORS}
+        
         # Load fonts
         try:
             self.font_large = pygame.font.SysFont('Arial', 72, bold=True)
@@ -1103,35 +1497,224 @@ class Game:
             self.font_medium = pygame.font.Font(None, 48)
             self.font_small = pygame.font.Font(None, 32)
             self.font_tiny = pygame.font.Font(None, 24)
+            
+        # Rendered text surfaces, most recently used last (see _text)
+        self._text_cache = {}
+        
+        # The wobbling title, one whole surface per phase of the wave
+        self._title_frames = self._create_title_frames()
+        
+        # The rest of the menu text is static too
+        self._create_menu_text()
+        
+        # HUD speed bar for every whole percent
+        self._speed_bars = [self._create_speed_bar(pct) for pct in range(101)]
         
         # Initialize sound manager
         self.sound_manager = SoundManager()
         
         # Load high scores from file
         self.high_scores = self._load_high_scores()
+        self._scores_dirty = False  # a new record is waiting to be written
         
         self.difficulty = 'NORMAL'
         self.background_stars = [BackgroundStar() for _ in range(15)]
         
-        # Screen shake effect
+        # Screen shake effect. Offsets come from a table filled once; each
+        # shake walks it from a random start, so shakes still differ
         self.screen_shake = 0
         self.shake_offset = (0, 0)
+        self._shake_table = [
+            (random.randint(-SHAKE_INTENSITY, SHAKE_INTENSITY),
+             random.randint(-SHAKE_INTENSITY, SHAKE_INTENSITY))
+            for _ in range(self.SHAKE_OFFSETS)
+        ]
+        self._shake_start = 0
         
         # Pause state
         self.paused = False
         
+        # Animation clock, sampled once per frame in update()
+        self.now_ms = pygame.time.get_ticks()
+        
+        # DOWN is tracked from KEYDOWN/KEYUP instead of polling the keyboard
+        self.down_held = False
+        
+        # Key handlers per screen; a handler returning False quits the game
+        difficulty_keys = {pygame.K_1: 'EASY', pygame.K_2: 'NORMAL', pygame.K_3: 'HARD'}
+        start_keys = {key: partial(self._start_game, difficulty)
+                      for key, difficulty in difficulty_keys.items()}
+        self._menu_keys = {
+            **start_keys,
+            pygame.K_SPACE: self._start_game,
+            pygame.K_RETURN: self._start_game,
+            pygame.K_q: self._quit,
+        }
+        self._game_over_keys = {
+            **start_keys,
+            pygame.K_SPACE: self._start_game,
+            pygame.K_m: self._open_menu,
+            pygame.K_q: self._quit,
+        }
+        self._play_keys = {
+            pygame.K_p: self._toggle_pause,
+            pygame.K_SPACE: self._jump,
+            pygame.K_UP: self._jump,
+            pygame.K_DOWN: self._duck,
+            pygame.K_r: self._start_game,
+            pygame.K_m: self._open_menu,
+            pygame.K_q: self._quit,
+        }
+        
         self.reset_game()
         
     def _create_sky_gradient(self):
         """Pre-render the sky gradient for better performance"""
-        sky = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_HEIGHT))
-        for y in range(SCREEN_HEIGHT - GROUND_HEIGHT):
-            ratio = y / (SCREEN_HEIGHT - GROUND_HEIGHT)
-            r = int(SKY_TOP[0] * (1 - ratio) + SKY_BOTTOM[0] * ratio)
-            g = int(SKY_TOP[1] * (1 - ratio) + SKY_BOTTOM[1] * ratio)
-            b = int(SKY_TOP[2] * (1 - ratio) + SKY_BOTTOM[2] * ratio)
-            pygame.draw.line(sky, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-        return sky
+        sky_height = SCREEN_HEIGHT - GROUND_HEIGHT
+        
+        # Interpolate each row into a 1px RGB column, then stretch it in C
+        column = bytearray()
+        for y in range(sky_height):
+            ratio = y / sky_height
+            column.extend(int(SKY_TOP[i] * (1 - ratio) + SKY_BOTTOM[i] * ratio) for i in range(3))
+        strip = pygame.image.frombuffer(bytes(column), (1, sky_height), 'RGB')
+        return pygame.transform.scale(strip, (SCREEN_WIDTH, sky_height)).convert()
+    
+    def _create_ground_strips(self):
+        """Pre-render the ground so scrolling it is two blits per frame.
+        
+        The grass layer (dirt, grass band and blades) scrolls at half the
+        speed of the pebble layer, so each gets its own strip, one spacing
+        wider than the screen on the left and right. draw_ground shifts them
+        exactly as the per-frame drawing used to.
+        """
+        # Grass layer; blades poke above the ground, so the strip starts
+        # GRASS_MARGIN px higher and is transparent there
+        width = SCREEN_WIDTH + 30
+        strip = pygame.Surface((width, GROUND_HEIGHT + self.GRASS_MARGIN)).convert()
+        strip.fill(SPRITE_KEY)
+        top = self.GRASS_MARGIN
+        pygame.draw.rect(strip, DIRT_BROWN, (0, top + 15, width, GROUND_HEIGHT - 15))
+        pygame.draw.rect(strip, GRASS_GREEN, (0, top, width, 18))
+        for j in range(width // 15 + 2):
+            x = j * 15
+            grass_height = 8 + ((j - 1) % 3) * 3  # blade j is on-screen blade j - 1
+            pygame.draw.line(strip, GRASS_LIGHT, (x, top), (x - 3, top - grass_height), 2)
+            pygame.draw.line(strip, GRASS_GREEN, (x + 5, top), (x + 7, top - grass_height + 2), 2)
+        strip.set_colorkey(SPRITE_KEY, pygame.RLEACCEL)
+        self.grass_strip = strip
+        
+        # Pebble layer; pebbles only sit on plain dirt, so the strip is opaque
+        # and covers just the rows they occupy
+        width = SCREEN_WIDTH + 55
+        strip = pygame.Surface((width, self.PEBBLE_ROWS[1] - self.PEBBLE_ROWS[0])).convert()
+        strip.fill(DIRT_BROWN)
+        y = 25 - self.PEBBLE_ROWS[0]
+        for j in range(width // 25 + 2):
+            x = j * 25
+            pygame.draw.circle(strip, (120, 70, 35), (x, y), 3)
+            pygame.draw.circle(strip, (100, 60, 30), (x + 12, y + 15), 2)
+        self.pebble_strip = strip
+        
+    def _create_title_frames(self):
+        """Compose the rainbow title once per wobble phase"""
+        glyphs = [
+            self.font_large.render(char, True, RAINBOW_COLORS[i % len(RAINBOW_COLORS)]).convert_alpha()
+            for i, char in enumerate("UNICORN DASH")
+        ]
+        # Letters bob 5px either way, so the frame starts 5px above TITLE_Y
+        width = (len(glyphs) - 1) * 40 + glyphs[-1].get_width()
+        height = self.font_large.get_height() + 10
+        frames = []
+        for p in range(self.TITLE_FRAMES):
+            phase = 2 * math.pi * p / self.TITLE_FRAMES
+            frame = pygame.Surface((width, height), pygame.SRCALPHA)
+            frame.blits([(glyph, (i * 40, int(5 + math.sin(phase + i * 0.5) * 5)))
+                         for i, glyph in enumerate(glyphs)], False)
+            frames.append(frame.convert_alpha())
+        return frames
+        
+    def _create_menu_text(self):
+        """Pre-render the menu's fixed labels at their final positions"""
+        center_x = SCREEN_WIDTH // 2
+        
+        def centered(font, text, color, center):
+            surf = font.render(text, True, color).convert_alpha()
+            return surf, surf.get_rect(center=center)
+        
+        # Subtitle, emoji, difficulty prompt and instructions
+        self._menu_static = [
+            centered(self.font_small, "✨ ENHANCED EDITION ✨", UNICORN_PURPLE,
+                     (center_x, self.TITLE_Y + 70)),
+            (self.font_large.render("🦄", True, WHITE).convert_alpha(),
+             (center_x - 30, self.TITLE_Y + 95)),
+            centered(self.font_small, "SELECT DIFFICULTY:", DARK_GRAY, (center_x, self.DIFFICULTY_Y)),
+        ]
+        instructions = [
+            "SPACE/UP = Jump (Double Jump!)  |  DOWN = Duck",
+            "P = Pause  |  R = Restart  |  M = Menu  |  Q = Quit",
+            "Collect ⭐ Stars & 🪙 Coins | Get 🛡️ Shields & 🧲 Magnets!",
+            "Press 1, 2, or 3 to select difficulty and start!"
+        ]
+        for i, inst in enumerate(instructions):
+            self._menu_static.append(
+                centered(self.font_tiny, inst, GRAY, (center_x, self.INSTRUCTIONS_Y + i * 25)))
+        
+        # Each difficulty option: its highlight box plus the label in its
+        # own color (unselected) and in white (selected)
+        self._menu_difficulties = []
+        for i, (key, diff) in enumerate(DIFFICULTIES.items()):
+            y = self.DIFFICULTY_Y + 40 + i * 40
+            text = f"[{i+1}] {diff['name']}"
+            self._menu_difficulties.append((
+                key,
+                diff['color'],
+                pygame.Rect(center_x - 100, y - 5, 200, 35),
+                centered(self.font_small, text, diff['color'], (center_x, y + 10)),
+                centered(self.font_small, text, WHITE, (center_x, y + 10)),
+            ))
+        
+    def _create_speed_bar(self, speed_pct):
+        """Render the HUD speed bar (outline plus fill) for one percentage"""
+        bar_width = 100
+        bar_height = 8
+        bar = pygame.Surface((bar_width, bar_height)).convert()
+        bar.fill(SPRITE_KEY)
+        pygame.draw.rect(bar, GRAY, (0, 0, bar_width, bar_height), 1)
+        fill_width = int(bar_width * speed_pct / 100)
+        bar_color = (100, 200, 100) if speed_pct < 50 else (200, 200, 100) if speed_pct < 80 else (200, 100, 100)
+        pygame.draw.rect(bar, bar_color, (0, 0, fill_width, bar_height))
+        bar.set_colorkey(SPRITE_KEY, pygame.RLEACCEL)
+        return bar
+        
+    def _create_overlay(self, color, alpha):
+        """Build a translucent full-screen tint (built once, blitted per frame)"""
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        overlay.fill(color)
+        overlay.set_alpha(alpha)
+        return overlay
+    
+    def _menu_tint(self, color):
+        """Return color as it looks under the menu overlay.
+        
+        The overlay is blended over a single pixel so the rounding is exactly
+        SDL's.
+        """
+        pixel = pygame.Surface((1, 1)).convert()
+        pixel.fill(color)
+        pixel.blit(self._menu_overlay, (0, 0))
+        return tuple(pixel.get_at((0, 0)))[:3]
+        
+    def _menu_tinted(self, surf):
+        """Return a colorkeyed sprite as it looks under the menu overlay"""
+        tinted = self._menu_tints.get(surf)
+        if tinted is None:
+            tinted = surf.copy()
+            tinted.blit(self._menu_overlay, (0, 0))
+            # The key color is tinted along with everything else
+            tinted.set_colorkey(self._menu_tint(surf.get_colorkey()), pygame.RLEACCEL)
+            self._menu_tints[surf] = tinted
+        return tinted
     
     def _load_high_scores(self):
         """Load high scores from file"""
@@ -1143,14 +1726,26 @@ class Game:
     
     def _save_high_scores(self):
         """Save high scores to file"""
+        self._scores_dirty = False
         try:
-            with open(HIGH_SCORE_FILE, 'w') as f:
+            # Write a temp file and swap it in, so a crash mid-write can't
+            # leave a truncated score file behind
+            tmp_file = HIGH_SCORE_FILE + '.tmp'
+            with open(tmp_file, 'w') as f:
                 json.dump(self.high_scores, f)
+            os.replace(tmp_file, HIGH_SCORE_FILE)
         except Exception as e:
             print(f"Could not save high scores: {e}")
+            
+    def _flush_high_scores(self):
+        """Save high scores if a new record was set since the last save"""
+        if self._scores_dirty:
+            self._save_high_scores()
         
     def reset_game(self):
         """Reset game state"""
+        self._flush_high_scores()
+        self._diff = DIFFICULTIES[self.difficulty]  # settings for the current run
         self.unicorn = Unicorn(self.difficulty)
         self.obstacles = []
         self.collectibles = []
@@ -1158,24 +1753,24 @@ class Game:
         self.clouds = [Cloud(random.randint(100, 800)) for _ in range(4)]
         self.score = 0
         self.coins_collected = 0
-        self.game_speed = DIFFICULTIES[self.difficulty]['initial_speed']
+        self.game_speed = self._diff['initial_speed']
         self.game_over = False
         self.obstacle_timer = 0
         self.ground_offset = 0
         self.show_menu = True
-        self.menu_particles = []
-        self.collect_particles = []
+        self.menu_particles = ParticleSystem()
+        self.collect_particles = ParticleSystem()
         self.paused = False
         self.screen_shake = 0
+        self._game_over_shown = False  # final game-over frame is on screen
         
     def trigger_screen_shake(self):
         """Start screen shake effect"""
         self.screen_shake = CONFIG['effects']['screen_shake_duration']
+        self._shake_start = random.randrange(self.SHAKE_OFFSETS)
         
     def spawn_obstacle(self):
         """Spawn a new obstacle"""
-        diff = DIFFICULTIES[self.difficulty]
-        
         dragon_chance = min(0.35, self.score / 4000)
         crystal_chance = 0.2
         
@@ -1214,150 +1809,154 @@ class Game:
         """Handle user input"""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                self._save_high_scores()
-                return False
+                return self._quit()
+                
+            if event.type == pygame.VIDEOEXPOSE:
+                # The window needs repainting, even if the frame is final
+                self._game_over_shown = False
                 
             if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_DOWN:
+                    self.down_held = True
+                    
                 if self.show_menu:
-                    if event.key == pygame.K_1:
-                        self.difficulty = 'EASY'
-                        self.reset_game()
-                        self.show_menu = False
-                    elif event.key == pygame.K_2:
-                        self.difficulty = 'NORMAL'
-                        self.reset_game()
-                        self.show_menu = False
-                    elif event.key == pygame.K_3:
-                        self.difficulty = 'HARD'
-                        self.reset_game()
-                        self.show_menu = False
-                    elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                        self.reset_game()
-                        self.show_menu = False
-                    elif event.key == pygame.K_q:
-                        self._save_high_scores()
-                        return False
-                        
+                    handlers = self._menu_keys
                 elif self.game_over:
-                    if event.key == pygame.K_SPACE:
-                        self.reset_game()
-                        self.show_menu = False
-                    elif event.key == pygame.K_1:
-                        self.difficulty = 'EASY'
-                        self.reset_game()
-                        self.show_menu = False
-                    elif event.key == pygame.K_2:
-                        self.difficulty = 'NORMAL'
-                        self.reset_game()
-                        self.show_menu = False
-                    elif event.key == pygame.K_3:
-                        self.difficulty = 'HARD'
-                        self.reset_game()
-                        self.show_menu = False
-                    elif event.key == pygame.K_m:
-                        self.show_menu = True
-                    elif event.key == pygame.K_q:
-                        self._save_high_scores()
-                        return False
-                        
+                    handlers = self._game_over_keys
                 else:  # Normal gameplay
-                    if event.key == pygame.K_p:
-                        self.paused = not self.paused
-                    elif event.key == pygame.K_SPACE or event.key == pygame.K_UP:
-                        if not self.paused:
-                            self.unicorn.jump(self.sound_manager)
-                    elif event.key == pygame.K_DOWN:
-                        if not self.paused:
-                            self.unicorn.duck(self.sound_manager)
-                    elif event.key == pygame.K_r:
-                        self.reset_game()
-                        self.show_menu = False
-                    elif event.key == pygame.K_m:
-                        self.show_menu = True
-                    elif event.key == pygame.K_q:
-                        self._save_high_scores()
-                        return False
+                    handlers = self._play_keys
+                    
+                handler = handlers.get(event.key)
+                if handler is not None and handler() is False:
+                    return False
                         
             if event.type == pygame.KEYUP:
-                if event.key == pygame.K_DOWN and not self.game_over and not self.show_menu:
-                    self.unicorn.stand_up()
+                if event.key == pygame.K_DOWN:
+                    self.down_held = False
+                    if not self.game_over and not self.show_menu:
+                        self.unicorn.stand_up()
         
         # Continuous key presses
-        keys = pygame.key.get_pressed()
-        if not self.game_over and not self.show_menu and not self.paused:
-            if keys[pygame.K_DOWN]:
-                self.unicorn.duck(self.sound_manager)
+        if self.down_held and not self.game_over and not self.show_menu and not self.paused:
+            self.unicorn.duck(self.sound_manager)
             
         return True
+    
+    def _start_game(self, difficulty=None):
+        """Start a fresh run, optionally switching difficulty first"""
+        if difficulty:
+            self.difficulty = difficulty
+        self.reset_game()
+        self.show_menu = False
+        
+    def _open_menu(self):
+        self._flush_high_scores()
+        self.show_menu = True
+        
+    def _toggle_pause(self):
+        self.paused = not self.paused
+        
+    def _jump(self):
+        if not self.paused:
+            self.unicorn.jump(self.sound_manager)
+            
+    def _duck(self):
+        if not self.paused:
+            self.unicorn.duck(self.sound_manager)
+            
+    def _quit(self):
+        """Save high scores and signal the main loop to stop"""
+        self._save_high_scores()
+        return False
         
     def update(self):
         """Update game state"""
+        # Sample the clock once per frame; every animation this frame
+        # (update and draw) shares the same phase
+        self.now_ms = pygame.time.get_ticks()
+        
         # Update screen shake
         if self.screen_shake > 0:
             self.screen_shake -= 1
-            intensity = CONFIG['effects']['screen_shake_intensity']
-            self.shake_offset = (
-                random.randint(-intensity, intensity),
-                random.randint(-intensity, intensity)
-            )
+            self.shake_offset = self._shake_table[
+                (self._shake_start + self.screen_shake) % self.SHAKE_OFFSETS]
         else:
             self.shake_offset = (0, 0)
         
         if self.show_menu or self.paused:
-            # Update menu particles
-            if random.random() < 0.2:
-                self.menu_particles.append(Particle(
-                    random.randint(0, SCREEN_WIDTH),
-                    random.randint(0, SCREEN_HEIGHT)
-                ))
-            for p in self.menu_particles:
-                p.update()
-            self.menu_particles = [p for p in self.menu_particles if not p.is_dead()]
+            # Update menu particles (positions picked as in ParticleSystem.spawn)
+            rand = random.random
+            if rand() < 0.2:
+                self.menu_particles.spawn(
+                    int(rand() * (SCREEN_WIDTH + 1)),
+                    int(rand() * (SCREEN_HEIGHT + 1))
+                )
+            self.menu_particles.update()
             return
             
         if self.game_over:
             # Continue death animation
             if self.unicorn.is_dying:
-                self.unicorn.update(self.game_speed)
+                self.unicorn.update(self.game_speed, self.now_ms)
                 if self.unicorn.death_timer <= 0:
                     self.unicorn.is_dying = False
+                    self._flush_high_scores()
             return
             
-        diff = DIFFICULTIES[self.difficulty]
+        diff = self._diff
         
         # Update unicorn
-        self.unicorn.update(self.game_speed)
+        self.unicorn.update(self.game_speed, self.now_ms, self.down_held)
         
         # Magnet effect - attract nearby collectibles
         if self.unicorn.magnet_active:
-            magnet_range = CONFIG['powerups']['magnet_range']
+            magnet_range = MAGNET_RANGE
+            range_sq = magnet_range * magnet_range
             unicorn_center = (self.unicorn.x + self.unicorn.width // 2, 
                             self.unicorn.y + self.unicorn.height // 2)
             for collectible in self.collectibles:
                 dx = unicorn_center[0] - collectible.x
                 dy = unicorn_center[1] - collectible.y
-                dist = math.sqrt(dx * dx + dy * dy)
-                if dist < magnet_range and dist > 0:
+                # Range test on the squared distance; only items that are
+                # actually pulled need the square root
+                dist_sq = dx * dx + dy * dy
+                if dist_sq < range_sq and dist_sq > 0:
+                    dist = math.sqrt(dist_sq)
                     speed = 8 * (1 - dist / magnet_range)
                     collectible.x += dx / dist * speed
                     collectible.y += dy / dist * speed
         
-        # Update obstacles
-        for obstacle in self.obstacles:
-            obstacle.update(self.game_speed)
-            
-        # Remove off-screen obstacles
-        self.obstacles = [o for o in self.obstacles if not o.is_off_screen()]
-        
-        # Update collectibles
-        for collectible in self.collectibles:
-            collectible.update(self.game_speed)
-        self.collectibles = [c for c in self.collectibles if not c.is_off_screen() and not c.collected]
+        # Update obstacles and drop the ones that scrolled off screen. Live
+        # items are packed to the front in place, so no new list is built
+        game_speed = self.game_speed
+        obstacles = self.obstacles
+        keep = 0
+        for obstacle in obstacles:
+            obstacle.update(game_speed)
+            if not obstacle.is_off_screen():
+                obstacles[keep] = obstacle
+                keep += 1
+        del obstacles[keep:]
+        
+        # Update collectibles (same in-place compaction)
+        collectibles = self.collectibles
+        keep = 0
+        for collectible in collectibles:
+            collectible.update(game_speed)
+            if not collectible.collected and not collectible.is_off_screen():
+                collectibles[keep] = collectible
+                keep += 1
+        del collectibles[keep:]
         
         # Update power-ups
-        for powerup in self.powerups:
-            powerup.update(self.game_speed)
-        self.powerups = [p for p in self.powerups if not p.is_off_screen() and not p.collected]
+        powerups = self.powerups
+        keep = 0
+        for powerup in powerups:
+            powerup.update(game_speed)
+            if not powerup.collected and not powerup.is_off_screen():
+                powerups[keep] = powerup
+                keep += 1
+        del powerups[keep:]
         
         # Spawn new obstacles
         self.obstacle_timer += 1
@@ -1367,28 +1966,37 @@ class Game:
             self.spawn_obstacle()
             
         # Spawn collectibles
-        if random.random() < CONFIG['collectibles']['spawn_chance']:
+        if random.random() < COLLECTIBLE_SPAWN_CHANCE:
             self.spawn_collectible()
             
         # Spawn power-ups (rarer)
-        if random.random() < CONFIG['collectibles']['powerup_spawn_chance'] and self.score > 200:
+        if random.random() < POWERUP_SPAWN_CHANCE and self.score > 200:
             self.spawn_powerup()
             
         # Update clouds
-        for cloud in self.clouds:
+        clouds = self.clouds
+        keep = 0
+        for cloud in clouds:
             cloud.update()
-        self.clouds = [c for c in self.clouds if not c.is_off_screen()]
+            if not cloud.is_off_screen():
+                clouds[keep] = cloud
+                keep += 1
+        del clouds[keep:]
         if len(self.clouds) < 5 and random.random() < 0.008:
             self.clouds.append(Cloud())
         
         # Update collect particles
-        for p in self.collect_particles:
-            p.update()
-        self.collect_particles = [p for p in self.collect_particles if not p.is_dead()]
+        self.collect_particles.update()
             
         # Check collisions with obstacles
         unicorn_rect = self.unicorn.get_rect()
+        hit_left, hit_right = unicorn_rect.left, unicorn_rect.right
         for obstacle in self.obstacles:
+            # Cheap x-range test first; obstacle hitboxes sit inside their
+            # x..x+width span, so anything outside it cannot collide. (Dragons
+            # overtake rocks, so the list is not sorted and we can't break.)
+            if obstacle.x > hit_right or obstacle.x + obstacle.width < hit_left:
+                continue
             if unicorn_rect.colliderect(obstacle.get_rect()):
                 # Check for shield
                 if self.unicorn.shield_active:
@@ -1397,16 +2005,17 @@ class Game:
                     self.obstacles.remove(obstacle)
                     # Particle burst
                     for _ in range(20):
-                        self.collect_particles.append(
-                            CollectParticle(obstacle.x + 20, obstacle.y + 20, SHIELD_BLUE))
+                        self.collect_particles.spawn_burst(obstacle.x + 20, obstacle.y + 20, SHIELD_BLUE)
                 else:
                     self.trigger_screen_shake()
                     self.sound_manager.play('hit')
                     self.unicorn.start_death_animation()
                     self.game_over = True
                     if self.score > self.high_scores[self.difficulty]:
+                        # Written once the frame is over (see
+                        # _flush_high_scores), not on the hit frame
                         self.high_scores[self.difficulty] = self.score
-                        self._save_high_scores()
+                        self._scores_dirty = True
                     return
                     
         # Check collisions with collectibles
@@ -1420,13 +2029,11 @@ class Game:
                 if isinstance(collectible, Star):
                     self.sound_manager.play('star')
                     for _ in range(15):
-                        self.collect_particles.append(
-                            CollectParticle(collectible.x, collectible.y, STAR_GOLD))
+                        self.collect_particles.spawn_burst(collectible.x, collectible.y, STAR_GOLD)
                 else:
                     self.sound_manager.play('coin')
                     for _ in range(10):
-                        self.collect_particles.append(
-                            CollectParticle(collectible.x, collectible.y, COIN_GOLD))
+                        self.collect_particles.spawn_burst(collectible.x, collectible.y, COIN_GOLD)
                         
         # Check collisions with power-ups
         for powerup in self.powerups:
@@ -1437,13 +2044,11 @@ class Game:
                 if powerup.type == 'shield':
                     self.unicorn.activate_shield()
                     for _ in range(20):
-                        self.collect_particles.append(
-                            CollectParticle(powerup.x, powerup.y, SHIELD_BLUE))
+                        self.collect_particles.spawn_burst(powerup.x, powerup.y, SHIELD_BLUE)
                 else:
                     self.unicorn.activate_magnet()
                     for _ in range(20):
-                        self.collect_particles.append(
-                            CollectParticle(powerup.x, powerup.y, MAGNET_RED))
+                        self.collect_particles.spawn_burst(powerup.x, powerup.y, MAGNET_RED)
                 
         # Update score and speed
         self.score += 1
@@ -1455,252 +2060,237 @@ class Game:
         # Update ground animation
         self.ground_offset = (self.ground_offset + self.game_speed) % 30
         
-    def draw_ground(self):
-        """Draw the ground with grass texture"""
-        pygame.draw.rect(self.screen, DIRT_BROWN, 
-                        (0, SCREEN_HEIGHT - GROUND_HEIGHT + 15, SCREEN_WIDTH, GROUND_HEIGHT - 15))
-        
-        pygame.draw.rect(self.screen, GRASS_GREEN,
-                        (0, SCREEN_HEIGHT - GROUND_HEIGHT, SCREEN_WIDTH, 18))
-        
-        for i in range(-1, SCREEN_WIDTH // 15 + 2):
-            x = i * 15 - int(self.ground_offset / 2)
-            grass_height = 8 + (i % 3) * 3
-            pygame.draw.line(self.screen, GRASS_LIGHT,
-                           (x, SCREEN_HEIGHT - GROUND_HEIGHT),
-                           (x - 3, SCREEN_HEIGHT - GROUND_HEIGHT - grass_height), 2)
-            pygame.draw.line(self.screen, GRASS_GREEN,
-                           (x + 5, SCREEN_HEIGHT - GROUND_HEIGHT),
-                           (x + 7, SCREEN_HEIGHT - GROUND_HEIGHT - grass_height + 2), 2)
-                           
-        for i in range(-1, SCREEN_WIDTH // 25 + 2):
-            x = i * 25 - int(self.ground_offset)
-            y = SCREEN_HEIGHT - GROUND_HEIGHT + 25
-            pygame.draw.circle(self.screen, (120, 70, 35), (x, y), 3)
-            pygame.draw.circle(self.screen, (100, 60, 30), (x + 12, y + 15), 2)
+    def draw_ground(self, surface=None):
+        """Draw the ground with grass texture (onto the screen by default)"""
+        surface = surface or self.screen
+        ground_top = SCREEN_HEIGHT - GROUND_HEIGHT
+        
+        # Grass scrolls at half speed with 15px blade spacing, pebbles at full
+        # speed with 25px spacing; the strips start one spacing off-screen
+        surface.blit(self.grass_strip,
+                     (-15 - int(self.ground_offset / 2), ground_top - self.GRASS_MARGIN))
+        surface.blit(self.pebble_strip,
+                     (-25 - int(self.ground_offset), ground_top + self.PEBBLE_ROWS[0]))
             
+    def _text(self, font, text, color):
+        """Render text with font, reusing the surface from earlier frames.
+        
+        Most labels are identical every frame; the few that change (score,
+        speed) just push the least recently used entry out of the cache.
+        """
+        key = (text, font, color)
+        cache = self._text_cache
+        surf = cache.pop(key, None)
+        if surf is None:
+            surf = font.render(text, True, color)
+            if len(cache) >= self.TEXT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        cache[key] = surf
+        return surf
+        
     def draw_ui(self):
         """Draw score and UI elements"""
-        diff = DIFFICULTIES[self.difficulty]
+        diff = self._diff
         
         # Score with shadow
-        score_text = self.font_small.render(f"SCORE: {self.score}", True, DARK_GRAY)
+        score_text = self._text(self.font_small, f"SCORE: {self.score}", DARK_GRAY)
         self.screen.blit(score_text, (SCREEN_WIDTH - 200, 20))
         
         # High score
-        hi_text = self.font_tiny.render(f"BEST: {self.high_scores[self.difficulty]}", True, GRAY)
+        hi_text = self._text(self.font_tiny, f"BEST: {self.high_scores[self.difficulty]}", GRAY)
         self.screen.blit(hi_text, (SCREEN_WIDTH - 200, 50))
         
         # Coins collected
-        coin_text = self.font_tiny.render(f"COINS: {self.coins_collected}", True, COIN_GOLD)
+        coin_text = self._text(self.font_tiny, f"COINS: {self.coins_collected}", COIN_GOLD)
         self.screen.blit(coin_text, (SCREEN_WIDTH - 200, 75))
         
         # Difficulty indicator
-        diff_text = self.font_tiny.render(f"MODE: {diff['name']}", True, diff['color'])
+        diff_text = self._text(self.font_tiny, f"MODE: {diff['name']}", diff['color'])
         self.screen.blit(diff_text, (20, 20))
         
         # Speed indicator
         max_speed = diff['max_speed']
         init_speed = diff['initial_speed']
         speed_pct = int((self.game_speed - init_speed) / (max_speed - init_speed) * 100)
-        speed_text = self.font_tiny.render(f"SPEED: {speed_pct}%", True, GRAY)
+        speed_text = self._text(self.font_tiny, f"SPEED: {speed_pct}%", GRAY)
         self.screen.blit(speed_text, (20, 45))
         
-        # Speed bar
-        bar_width = 100
-        bar_height = 8
-        pygame.draw.rect(self.screen, GRAY, (20, 70, bar_width, bar_height), 1)
-        fill_width = int(bar_width * speed_pct / 100)
-        bar_color = (100, 200, 100) if speed_pct < 50 else (200, 200, 100) if speed_pct < 80 else (200, 100, 100)
-        pygame.draw.rect(self.screen, bar_color, (20, 70, fill_width, bar_height))
+        # Speed bar (pre-rendered per percent; game_speed never passes max)
+        self.screen.blit(self._speed_bars[speed_pct], (20, 70))
         
         # Power-up indicators
         indicator_y = 95
         if self.unicorn.shield_active:
-            remaining = self.unicorn.shield_timer / CONFIG['powerups']['shield_duration']
+            remaining = self.unicorn.shield_timer / SHIELD_DURATION
             pygame.draw.rect(self.screen, SHIELD_BLUE, (20, indicator_y, int(100 * remaining), 8))
-            shield_text = self.font_tiny.render("SHIELD", True, SHIELD_BLUE)
+            shield_text = self._text(self.font_tiny, "SHIELD", SHIELD_BLUE)
             self.screen.blit(shield_text, (20, indicator_y + 10))
             indicator_y += 35
             
         if self.unicorn.magnet_active:
-            remaining = self.unicorn.magnet_timer / CONFIG['powerups']['magnet_duration']
+            remaining = self.unicorn.magnet_timer / MAGNET_DURATION
             pygame.draw.rect(self.screen, MAGNET_RED, (20, indicator_y, int(100 * remaining), 8))
-            magnet_text = self.font_tiny.render("MAGNET", True, MAGNET_RED)
+            magnet_text = self._text(self.font_tiny, "MAGNET", MAGNET_RED)
             self.screen.blit(magnet_text, (20, indicator_y + 10))
         
     def draw_menu(self):
         """Draw the main menu"""
-        self.screen.blit(self.sky_surface, (0, 0))
+        # The scene under the menu overlay is drawn with pre-tinted art
+        # instead of blending the overlay over the finished scene. Every
+        # layer is opaque, so the pixels are the same, minus a full-screen
+        # alpha blit. The ground never overlaps the sky layers, so it is
+        # baked into the background with the sky
+        if self._menu_background_offset != self.ground_offset:
+            background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            background.blit(self.sky_surface, (0, 0))
+            self.draw_ground(background)
+            background.blit(self._menu_overlay, (0, 0))
+            self._menu_background = background
+            self._menu_background_offset = self.ground_offset
+        self.screen.blit(self._menu_background, (0, 0))
         
         for star in self.background_stars:
-            star.draw(self.screen)
-            
-        for cloud in self.clouds:
-            cloud.draw(self.screen)
+            star.draw(self.screen, self.now_ms, self._menu_twinkle)
             
-        self.draw_ground()
-        
-        for p in self.menu_particles:
-            p.draw(self.screen)
+        self.screen.blits([(self._menu_tinted(surf), pos)
+                           for surf, pos in (cloud.sprite() for cloud in self.clouds)], False)
         
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(120)
-        overlay.fill((255, 240, 245))
-        self.screen.blit(overlay, (0, 0))
+        self.menu_particles.draw(self.screen, self._menu_sparkles)
         
         # Title with rainbow effect
-        title = "UNICORN DASH"
-        title_y = 60
-        for i, char in enumerate(title):
-            color = RAINBOW_COLORS[i % len(RAINBOW_COLORS)]
-            char_surf = self.font_large.render(char, True, color)
-            x = SCREEN_WIDTH // 2 - 250 + i * 40
-            y = title_y + math.sin(pygame.time.get_ticks() * 0.005 + i * 0.5) * 5
-            self.screen.blit(char_surf, (x, y))
-        
-        # Enhanced subtitle
-        subtitle = self.font_small.render("✨ ENHANCED EDITION ✨", True, UNICORN_PURPLE)
-        subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, title_y + 70))
-        self.screen.blit(subtitle, subtitle_rect)
-        
-        # Unicorn emoji
-        emoji_text = self.font_large.render("🦄", True, WHITE)
-        self.screen.blit(emoji_text, (SCREEN_WIDTH // 2 - 30, title_y + 95))
+        phase = int(self.now_ms * 0.005 * self.TITLE_FRAMES / (2 * math.pi))
+        self.screen.blit(self._title_frames[phase % self.TITLE_FRAMES],
+                         (SCREEN_WIDTH // 2 - 250, self.TITLE_Y - 5))
         
-        # Difficulty selection
-        diff_y = 220
-        select_text = self.font_small.render("SELECT DIFFICULTY:", True, DARK_GRAY)
-        select_rect = select_text.get_rect(center=(SCREEN_WIDTH // 2, diff_y))
-        self.screen.blit(select_text, select_rect)
+        # Subtitle, prompt and instructions (pre-rendered)
+        self.screen.blits(self._menu_static, False)
         
-        for i, (key, diff) in enumerate(DIFFICULTIES.items()):
-            y = diff_y + 40 + i * 40
-            text = f"[{i+1}] {diff['name']}"
-            color = diff['color']
-            
+        # Difficulty selection
+        for key, color, highlight, label, selected_label in self._menu_difficulties:
             if key == self.difficulty:
-                pygame.draw.rect(self.screen, color, 
-                               (SCREEN_WIDTH // 2 - 100, y - 5, 200, 35), 
-                               border_radius=10)
-                text_color = WHITE
+                pygame.draw.rect(self.screen, color, highlight, border_radius=10)
+                self.screen.blit(*selected_label)
             else:
-                text_color = color
-                
-            diff_text = self.font_small.render(text, True, text_color)
-            diff_rect = diff_text.get_rect(center=(SCREEN_WIDTH // 2, y + 10))
-            self.screen.blit(diff_text, diff_rect)
-        
-        # Instructions
-        inst_y = 390
-        instructions = [
-            "SPACE/UP = Jump (Double Jump!)  |  DOWN = Duck",
-            "P = Pause  |  R = Restart  |  M = Menu  |  Q = Quit",
-            "Collect ⭐ Stars & 🪙 Coins | Get 🛡️ Shields & 🧲 Magnets!",
-            "Press 1, 2, or 3 to select difficulty and start!"
-        ]
-        for i, inst in enumerate(instructions):
-            inst_text = self.font_tiny.render(inst, True, GRAY)
-            inst_rect = inst_text.get_rect(center=(SCREEN_WIDTH // 2, inst_y + i * 25))
-            self.screen.blit(inst_text, inst_rect)
+                self.screen.blit(*label)
         
     def draw_game_over(self):
         """Draw game over screen"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill((255, 240, 245))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._game_over_overlay, (0, 0))
         
-        go_text = self.font_large.render("GAME OVER", True, (180, 80, 120))
+        go_text = self._text(self.font_large, "GAME OVER", (180, 80, 120))
         go_rect = go_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
         self.screen.blit(go_text, go_rect)
         
-        score_text = self.font_medium.render(f"Score: {self.score}", True, DARK_GRAY)
+        score_text = self._text(self.font_medium, f"Score: {self.score}", DARK_GRAY)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
         self.screen.blit(score_text, score_rect)
         
-        coins_text = self.font_small.render(f"Coins Collected: {self.coins_collected}", True, COIN_GOLD)
+        coins_text = self._text(self.font_small, f"Coins Collected: {self.coins_collected}", COIN_GOLD)
         coins_rect = coins_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
         self.screen.blit(coins_text, coins_rect)
         
         if self.score >= self.high_scores[self.difficulty] and self.score > 0:
-            new_hi = self.font_small.render("✨ NEW HIGH SCORE! ✨", True, UNICORN_GOLD)
+            new_hi = self._text(self.font_small, "✨ NEW HIGH SCORE! ✨", UNICORN_GOLD)
             new_hi_rect = new_hi.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 55))
             self.screen.blit(new_hi, new_hi_rect)
         
-        diff = DIFFICULTIES[self.difficulty]
-        diff_text = self.font_tiny.render(f"Difficulty: {diff['name']}", True, diff['color'])
+        diff = self._diff
+        diff_text = self._text(self.font_tiny, f"Difficulty: {diff['name']}", diff['color'])
         diff_rect = diff_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90))
         self.screen.blit(diff_text, diff_rect)
         
-        restart_text = self.font_tiny.render("SPACE = Play Again | 1/2/3 = Change Difficulty | M = Menu", True, GRAY)
+        restart_text = self._text(self.font_tiny, "SPACE = Play Again | 1/2/3 = Change Difficulty | M = Menu", GRAY)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 125))
         self.screen.blit(restart_text, restart_rect)
         
     def draw_pause(self):
         """Draw pause overlay"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(150)
-        overlay.fill((100, 100, 150))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._pause_overlay, (0, 0))
         
-        pause_text = self.font_large.render("PAUSED", True, WHITE)
+        pause_text = self._text(self.font_large, "PAUSED", WHITE)
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
         self.screen.blit(pause_text, pause_rect)
         
-        resume_text = self.font_small.render("Press P to Resume", True, WHITE)
+        resume_text = self._text(self.font_small, "Press P to Resume", WHITE)
         resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
         self.screen.blit(resume_text, resume_rect)
         
     def draw(self):
         """Render the game"""
-        # Create render surface for screen shake
-        render_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        now_ms = self.now_ms
         
         if self.show_menu:
             self.draw_menu()
             pygame.display.flip()
             return
         
+        # Once the death animation and shake are over, the game-over screen
+        # does not change (the scene is frozen under its overlay), so it is
+        # drawn and presented once instead of every frame
+        game_over_final = (self.game_over and not self.unicorn.is_dying
+                           and self.screen_shake == 0)
+        if game_over_final and self._game_over_shown:
+            return
+        self._game_over_shown = game_over_final
+        
+        # The scene is drawn straight onto the screen; a shaking frame goes
+        # through the offscreen surface so it can be blitted offset
+        shaking = self.shake_offset != (0, 0)
+        render_surface = self._shake_surface if shaking else self.screen
+        
         # Draw sky (pre-rendered for optimization)
         render_surface.blit(self.sky_surface, (0, 0))
         
         # Draw background stars
         for star in self.background_stars:
-            star.draw(render_surface)
+            star.draw(render_surface, now_ms)
+        
+        # Entities spawn past the right edge; skip them until they can be
+        # seen (the left edge is handled by removing them in update)
+        right_edge = SCREEN_WIDTH + self.OFFSCREEN_MARGIN
         
-        # Draw clouds
-        for cloud in self.clouds:
-            cloud.draw(render_surface)
+        # Draw clouds (one batched blit call)
+        render_surface.blits([cloud.sprite() for cloud in self.clouds if cloud.x < right_edge], False)
             
         # Draw ground
-        # Temporarily swap screen reference for ground drawing
-        original_screen = self.screen
-        self.screen = render_surface
-        self.draw_ground()
-        self.screen = original_screen
+        self.draw_ground(render_surface)
         
         # Draw collectibles
         for collectible in self.collectibles:
-            collectible.draw(render_surface)
+            if collectible.x < right_edge:
+                collectible.draw(render_surface, now_ms)
             
         # Draw power-ups
         for powerup in self.powerups:
-            powerup.draw(render_surface)
+            if powerup.x < right_edge:
+                powerup.draw(render_surface, now_ms)
         
-        # Draw obstacles
+        # Draw obstacles. Plain rocks are a single sprite each, so runs of
+        # them go out in one blits call; the batch is flushed before any
+        # obstacle drawn live to keep the stacking order
+        batch = []
         for obstacle in self.obstacles:
-            obstacle.draw(render_surface)
+            if obstacle.x >= right_edge:
+                continue
+            if isinstance(obstacle, Rock) and obstacle.variant != 'crystal':
+                batch.append(obstacle.sprite())
+                continue
+            if batch:
+                render_surface.blits(batch, False)
+                batch.clear()
+            obstacle.draw(render_surface, now_ms)
+        if batch:
+            render_surface.blits(batch, False)
             
         # Draw collect particles
-        for p in self.collect_particles:
-            p.draw(render_surface)
+        self.collect_particles.draw(render_surface)
             
         # Draw unicorn
-        self.unicorn.draw(render_surface)
+        self.unicorn.draw(render_surface, now_ms)
         
-        # Apply screen shake and blit to actual screen
-        self.screen.blit(render_surface, self.shake_offset)
+        # Apply screen shake
+        if shaking:
+            self.screen.blit(render_surface, self.shake_offset)
         
         # Draw UI (not affected by shake)
         self.draw_ui()
@@ -2,12 +2,28 @@ import random
 from phrasehunter.phrase import Phrase
 
 
+# Phrase objects never change once built, so every game shares these
+PHRASES = (
+    Phrase("hello world"),
+    Phrase("python is fun"),
+    Phrase("practice makes perfect"),
+    Phrase("keep it simple"),
+    Phrase("never give up"),
+)
+
+# Banner shown before every round (the trailing newline leaves a blank line)
+WELCOME_BANNER = "=" * 28 + "\n  Welcome to Phrase Hunter\n" + "=" * 28 + "\n"
+
+
 class Game:
     """
     Manages the Phrase Hunter game logic including game state,
     user interaction, and win/loss conditions.
     """
     
+    # Fixed attributes; no per-instance __dict__
+    __slots__ = ("missed", "phrases", "active_phrase", "guesses")
+    
     def __init__(self):
         """
         Initialize a new Game with default values.
@@ -16,30 +32,36 @@ class Game:
         # Track the number of incorrect guesses (game over at 5)
         self.missed = 0
         
-        # List of Phrase objects to use in the game
-        self.phrases = [
-            Phrase("hello world"),
-            Phrase("python is fun"),
-            Phrase("practice makes perfect"),
-            Phrase("keep it simple"),
-            Phrase("never give up")
-        ]
+        # Phrase objects to use in the game
+        self.phrases = PHRASES
         
         # The current phrase being played
         self.active_phrase = self.get_random_phrase()
         
-        # List of letters the user has guessed (starts with space so spaces display)
-        self.guesses = [" "]
+        # Set of letters the user has guessed (starts with space so spaces display)
+        self.guesses = {" "}
     
     def start(self):
         """
         Start the game loop.
-        Displays welcome message, and runs the main game loop.
-        Prompts to play again when game ends.
+        Plays rounds until the player chooses not to play again.
+        Loops rather than calling itself, so long sessions don't grow the stack.
+        """
+        while True:
+            # Display welcome message and play one round
+            self.welcome()
+            self.play_round()
+            
+            # Ask if player wants to play again
+            if not self.play_again():
+                print("\nThanks for playing Phrase Hunter! Goodbye!")
+                break
+            self.reset()
+    
+    def play_round(self):
+        """
+        Run the main game loop for the active phrase and show the result.
         """
-        # Display welcome message
-        self.welcome()
-        
         # Main game loop - continues until win (phrase complete) or loss (5 misses)
         while self.missed < 5 and not self.active_phrase.check_complete(self.guesses):
             # Print the number of misses
@@ -51,8 +73,8 @@ class Game:
             # Get a guess from the user
             user_guess = self.get_guess()
             
-            # Add the guess to the list of guesses
-            self.guesses.append(user_guess)
+            # Add the guess to the set of guesses
+            self.guesses.add(user_guess)
             
             # Check if the guess is incorrect
             if not self.active_phrase.check_guess(user_guess):
@@ -61,13 +83,6 @@ class Game:
         
         # Game has ended - show result
         self.game_over()
-        
-        # Ask if player wants to play again
-        if self.play_again():
-            self.reset()
-            self.start()
-        else:
-            print("\nThanks for playing Phrase Hunter! Goodbye!")
     
     def reset(self):
         """
@@ -76,7 +91,7 @@ class Game:
         """
         self.missed = 0
         self.active_phrase = self.get_random_phrase()
-        self.guesses = [" "]
+        self.guesses = {" "}
     
     def get_random_phrase(self):
         """
@@ -91,10 +106,7 @@ class Game:
         """
         Display a friendly welcome message at the start of the game.
         """
-        print("=" * 28)
-        print("  Welcome to Phrase Hunter")
-        print("=" * 28)
-        print()
+        print(WELCOME_BANNER)
     
     def get_guess(self):
         """
@@ -113,8 +125,9 @@ class Game:
                 print("Error: Please enter exactly one character.")
                 continue
             
-            # Validate that the input is a letter (a-z)
-            if not guess.isalpha():
+            # Validate that the input is a letter (a-z); isalpha() would also
+            # let through letters like "é" that no phrase can contain
+            if not "a" <= guess <= "z":
                 print("Error: Please enter a letter (a-z), not a number or symbol.")
                 continue
             
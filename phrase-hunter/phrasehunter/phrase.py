@@ -4,6 +4,9 @@ class Phrase:
     Handles displaying the phrase and checking letter guesses.
     """
     
+    # Fixed attributes; no per-instance __dict__
+    __slots__ = ("phrase", "letters")
+    
     def __init__(self, phrase):
         """
         Initialize a Phrase object with the given phrase.
@@ -12,6 +15,9 @@ class Phrase:
             phrase: The phrase string to be guessed (converted to lowercase)
         """
         self.phrase = phrase.lower()
+        
+        # The distinct letters of the phrase (spaces excluded), computed once
+        self.letters = frozenset(self.phrase.replace(" ", ""))
     
     def display(self, guesses):
         """
@@ -19,42 +25,38 @@ class Phrase:
         Spaces between words remain visible. Prints directly to console.
         
         Args:
-            guesses: A list of letters that have been guessed
-        """
-        for letter in self.phrase:
-            if letter in guesses:
-                # Show the letter (including spaces since " " is in guesses)
-                print(f"{letter}", end=" ")
-            else:
-                # Show underscore for unguessed letters
-                print("_", end=" ")
-        # Print newline at the end
-        print()
+            guesses: A set of letters that have been guessed
+        """
+        # Map every letter not guessed yet to an underscore, then swap them
+        # all out in a single translate pass (spaces are never hidden)
+        hidden = {ord(letter): "_" for letter in self.letters if letter not in guesses}
+        masked = self.phrase.translate(hidden)
+        
+        # Print each character followed by a space, on one line
+        print(" ".join(masked) + " ")
     
     def check_guess(self, guess):
         """
         Check if the given letter is in the phrase.
         
         Args:
-            guess: The letter to check
+            guess: The (lowercase) letter to check
         
         Returns:
             True if the letter is in the phrase, False otherwise
         """
-        return guess.lower() in self.phrase
+        # Guesses come from Game.get_guess already lowercased, like the phrase
+        return guess in self.letters
     
     def check_complete(self, guesses):
         """
         Check if the entire phrase has been guessed.
         
         Args:
-            guesses: A list of letters that have been guessed
+            guesses: A set of letters that have been guessed
         
         Returns:
             True if all letters in the phrase have been guessed, False otherwise
         """
-        for letter in self.phrase:
-            # If any letter hasn't been guessed, phrase is not complete
-            if letter not in guesses:
-                return False
-        return True
+        # Complete once every distinct letter has been guessed
+        return self.letters.issubset(guesses)